@@ -4,8 +4,6 @@ import jlserve
 from pydantic import BaseModel
 import base64
 from io import BytesIO
-import torch
-from diffusers import FluxPipeline
 
 
 class PromptInput(BaseModel):
@@ -37,6 +35,9 @@ class FluxSchnell:
 
     def setup(self):
         """Initialize the Flux-Schnell model. Called once on app startup."""
+        import torch
+        from diffusers import FluxPipeline
+
         self.pipe = FluxPipeline.from_pretrained(
             "black-forest-labs/FLUX.1-schnell",
             torch_dtype=torch.bfloat16,
@@ -1,6 +1,41 @@
 """JLServe - A simple framework for creating ML endpoints."""
 
-from jlserve.decorator import app, endpoint
+import os
 
 __version__ = "0.1.0"
-__all__ = ["app", "endpoint"]
+__all__ = ["app", "endpoint", "ok"]
+
+
+def ok(**fields) -> dict:
+    """Build an endpoint result as a plain dict instead of an output model.
+
+    The dict is validated against the endpoint's declared return type when
+    the response is serialized, so ``return jlserve.ok(result=3)`` is
+    equivalent to ``return Output(result=3)`` without running the model's
+    constructor in the endpoint itself.
+    """
+    return fields
+
+
+def __getattr__(name: str):
+    """Resolve the public decorators lazily on first access.
+
+    ``jlserve.Struct`` is an alias for ``msgspec.Struct`` and requires the
+    optional msgspec dependency.
+    """
+    if name == "Struct":
+        from msgspec import Struct
+
+        globals()[name] = Struct
+        return Struct
+    if name in __all__:
+        from jlserve import decorator
+
+        value = getattr(decorator, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if os.environ.get("JLSERVE_EAGER_IMPORT") == "1":
+    from jlserve.decorator import app, endpoint  # noqa: F401
@@ -0,0 +1,24 @@
+"""Pydantic models shared by the test modules.
+
+Defined once so each model class (and its pydantic-core schema) is built a
+single time per test session instead of once per test module.
+"""
+
+from pydantic import BaseModel
+
+
+class Input(BaseModel):
+    value: int
+
+
+class Output(BaseModel):
+    result: int
+
+
+class TwoNumbers(BaseModel):
+    a: int
+    b: int
+
+
+class Result(BaseModel):
+    result: int
@@ -1,34 +1,104 @@
 """CLI implementation for JLServe."""
 
-import importlib.util
-import subprocess
+import hashlib
+import json
+import os
 import sys
 from pathlib import Path
 
 import typer
-import uvicorn
 
 from jlserve.decorator import _reset_registry, get_endpoint_methods, get_registered_app
 from jlserve.requirements import extract_requirements_from_file
-from jlserve.server import create_app
 
 app = typer.Typer(
     help="JLServe - A simple framework for creating ML endpoints",
     no_args_is_help=True,
     add_completion=False,
+    pretty_exceptions_enable=False,
+    rich_markup_mode=None,
 )
 
 
+def get_jlserve_cache_dir() -> Path:
+    """Return the directory used for JLServe's local caches.
+
+    JLSERVE_CACHE_DIR overrides the default of $XDG_CACHE_HOME/jlserve
+    (~/.cache/jlserve).
+    """
+    cache_dir = os.environ.get("JLSERVE_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "jlserve"
+
+
+def _requirements_marker(requirements: list[str]) -> Path:
+    """Return the marker file recording that requirements were installed.
+
+    The key covers the interpreter prefix as well as the requirement set, so
+    switching virtual environments triggers a fresh install.
+    """
+    key_source = "\n".join([sys.prefix, *sorted(requirements)])
+    key = hashlib.sha256(key_source.encode()).hexdigest()
+    return get_jlserve_cache_dir() / "satisfied" / key
+
+
+def _extract_requirements_cached(file: Path) -> list[str]:
+    """Extract requirements from a file, reusing a cached result if unchanged.
+
+    Results are cached under the JLServe cache dir keyed by the file's
+    absolute path, mtime and size, so any edit invalidates the entry.
+    """
+    path = file.resolve()
+    st = path.stat()
+    key = hashlib.sha1(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode()).hexdigest()
+    cache_file = get_jlserve_cache_dir() / "reqs" / f"{key}.json"
+
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+
+    requirements = extract_requirements_from_file(str(file))
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(requirements))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+    return requirements
+
+
+def _uvicorn_speedup_kwargs() -> dict:
+    """Pin uvloop and httptools when installed so uvicorn skips auto-detection."""
+    try:
+        import httptools  # noqa: F401
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+    return {"loop": "uvloop", "http": "httptools"}
+
+
+# Not a no-op: with a single command and no callback, Typer would run dev
+# as the root command, turning `jlserve dev app.py` into `jlserve app.py`
 @app.callback()
 def callback() -> None:
     """JLServe - A simple framework for creating ML endpoints."""
-    pass
 
 
 @app.command("dev")
 def dev(
     file: Path = typer.Argument(..., help="Path to the Python file containing the app"),
     port: int = typer.Option(8000, "--port", "-p", help="Port to serve on"),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Profile requests sent with ?profile=1 using pyinstrument (pip install jlserve[profile])",
+    ),
 ) -> None:
     """Run an app locally for development."""
     if not file.exists():
@@ -41,7 +111,7 @@ def dev(
 
     # Step 1: Extract requirements via AST (before importing to avoid import errors)
     try:
-        requirements = extract_requirements_from_file(str(file))
+        requirements = _extract_requirements_cached(file)
     except SyntaxError as e:
         typer.echo(f"Error: Invalid Python syntax in {file}: {e}", err=True)
         raise typer.Exit(1)
@@ -49,13 +119,20 @@ def dev(
         typer.echo(f"Error: Failed to extract requirements from {file}: {e}", err=True)
         raise typer.Exit(1)
 
-    # Step 2: Install requirements with uv (shows output, fast if already satisfied)
-    if requirements:
+    # Step 2: Install requirements with uv, skipped if this exact set was
+    # already installed into the current environment
+    marker_file = _requirements_marker(requirements) if requirements else None
+    if marker_file is not None and os.path.exists(marker_file):
+        typer.echo(f"Requirements already installed: {', '.join(requirements)}")
+    elif requirements:
         typer.echo(f"Installing requirements: {', '.join(requirements)}")
+        import subprocess
+
         try:
             subprocess.run(
-                ["uv", "pip", "install", *requirements],
+                ["uv", "pip", "install", "--quiet", "--no-progress", *requirements],
                 check=True,
+                stdin=subprocess.DEVNULL,
             )
         except subprocess.CalledProcessError as e:
             typer.echo(f"Error: Failed to install requirements: {e}", err=True)
@@ -67,10 +144,23 @@ def dev(
             )
             raise typer.Exit(1)
 
+        try:
+            marker_file.parent.mkdir(parents=True, exist_ok=True)
+            # Only the marker's existence matters, so create it without
+            # touch()'s extra stat/utime calls
+            os.close(os.open(marker_file, os.O_WRONLY | os.O_CREAT, 0o644))
+        except OSError:
+            # The marker is only an optimization; never fail the run over it
+            pass
+
     # Clear any previously registered app
     _reset_registry()
 
-    # Load the user's Python file
+    # Load the user's Python file. The SourceFileLoader behind
+    # spec_from_file_location reads and writes the __pycache__ bytecode
+    # cache, so warm runs skip recompiling unchanged sources.
+    import importlib.util
+
     spec = importlib.util.spec_from_file_location("user_module", file)
     if spec is None or spec.loader is None:
         typer.echo(f"Error: Could not load file: {file}", err=True)
@@ -99,7 +189,7 @@ def dev(
 
     app_name = getattr(app_cls, "_jlserve_app_name", "app")
 
-    # Get endpoint methods for display
+    # Make sure there is something to serve
     endpoint_methods = get_endpoint_methods(app_cls)
     if not endpoint_methods:
         typer.echo(
@@ -108,19 +198,22 @@ def dev(
         )
         raise typer.Exit(1)
 
-    # Create the FastAPI app
-    fastapi_app = create_app(app_cls)
+    # Deferred so --help and error paths don't pay for the server stack
+    import uvicorn
 
-    # Print startup message
-    typer.echo(f"\nServing {app_name} at http://localhost:{port}")
-    typer.echo(f"Docs at http://localhost:{port}/docs\n")
+    from jlserve.server import create_app
 
-    # Print all available endpoints
-    routes = [f"POST {m._jlserve_endpoint_path}" for m in endpoint_methods]
-    typer.echo(f"Endpoints: {', '.join(routes)}\n")
+    # Create the FastAPI app; it prints the startup banner once setup() is done
+    fastapi_app = create_app(app_cls, port=port, profile=profile)
 
     # Start Uvicorn server
-    uvicorn.run(fastapi_app, host="0.0.0.0", port=port, log_level="info")
+    uvicorn.run(
+        fastapi_app,
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        **_uvicorn_speedup_kwargs(),
+    )
 
 
 if __name__ == "__main__":
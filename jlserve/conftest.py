@@ -0,0 +1,73 @@
+"""Shared pytest fixtures.
+
+Every test starts and ends with an empty app registry, so tests can define
+their own @jlserve.app() class without clearing it first. The registry is
+module state, which pytest-xdist keeps separate per worker process, so the
+suite can run in parallel with ``pytest -n auto``.
+
+Apps used by more than one test module are built and started once per test
+session. Each fixture registers its app and then clears the registry again,
+so tests that define their own app are unaffected.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import jlserve
+from jlserve._test_models import Input, Output, Result, TwoNumbers
+from jlserve.decorator import _reset_registry
+from jlserve.server import create_app
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    """Clear the app registry around every test."""
+    _reset_registry()
+    yield
+    _reset_registry()
+
+
+@pytest.fixture(scope="session")
+def calculator_client():
+    """A started client for a Calculator app with add/subtract/multiply endpoints."""
+    _reset_registry()
+
+    @jlserve.app(name="Calculator")
+    class Calculator:
+        def setup(self):
+            self.operation_count = 0
+
+        @jlserve.endpoint()
+        def add(self, input: TwoNumbers) -> Result:
+            self.operation_count += 1
+            return Result(result=input.a + input.b)
+
+        @jlserve.endpoint()
+        def subtract(self, input: TwoNumbers) -> Result:
+            self.operation_count += 1
+            return Result(result=input.a - input.b)
+
+        @jlserve.endpoint()
+        def multiply(self, input: TwoNumbers) -> Result:
+            self.operation_count += 1
+            return Result(result=input.a * input.b)
+
+    _reset_registry()
+    with TestClient(create_app(Calculator)) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def process_client():
+    """A started client for an app with a single /process endpoint echoing its input."""
+    _reset_registry()
+
+    @jlserve.app()
+    class Echo:
+        @jlserve.endpoint()
+        def process(self, input: Input) -> Output:
+            return Output(result=input.value)
+
+    _reset_registry()
+    with TestClient(create_app(Echo)) as client:
+        yield client
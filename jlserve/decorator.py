@@ -1,7 +1,9 @@
 """Decorators for defining JLServe apps and endpoints."""
 
-import functools
-from typing import Callable, Optional, Type
+import inspect
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Type, get_type_hints
 
 from jlserve.exceptions import MultipleAppsError
 
@@ -9,6 +11,22 @@ from jlserve.exceptions import MultipleAppsError
 _registered_app: Optional[Type] = None
 
 
+@dataclass(frozen=True, slots=True)
+class EndpointMeta:
+    """Resolved signature of an endpoint method.
+
+    Attributes:
+        input_param: Name of the input parameter (the one after ``self``),
+            or None if the method takes no input.
+        input_type: Type hint of the input parameter, or None if missing.
+        output_type: Return type hint, or None if missing.
+    """
+
+    input_param: Optional[str]
+    input_type: Any
+    output_type: Any
+
+
 def app(name: Optional[str] = None, requirements: Optional[list[str]] = None):
     """Decorator to mark a class as a JLServe app.
 
@@ -60,13 +78,17 @@ def app(name: Optional[str] = None, requirements: Optional[list[str]] = None):
         cls._jlserve_app = True
         cls._jlserve_app_name = name if name else cls.__name__
         cls._jlserve_requirements = requirements if requirements else []
+        cls._jlserve_has_setup = callable(getattr(cls, "setup", None))
+        cls._jlserve_endpoint_methods = _collect_endpoint_methods(cls)
         _registered_app = cls
         return cls
 
     return decorator
 
 
-def endpoint(path: Optional[str] = None):
+def endpoint(
+    path: Optional[str] = None, trusted_output: bool = False, blocking: bool = True
+):
     """Decorator to mark a method as a JLServe endpoint.
 
     The endpoint path is automatically derived from the method name unless
@@ -74,45 +96,122 @@ def endpoint(path: Optional[str] = None):
 
     Args:
         path: Optional custom route path. Defaults to "/" + method name.
+        trusted_output: If True, a dict returned by the endpoint is turned
+            into the output model with ``model_construct()``, skipping
+            validation. Only use this for endpoints whose results never
+            contain unvalidated user data.
+        blocking: Whether a plain (non-async) method may block. Blocking
+            methods run in a worker thread so they don't stall other
+            requests. Set to False for fast, pure-Python methods to call them
+            directly on the event loop and skip the thread hand-off. Ignored
+            for ``async def`` methods.
 
     Returns:
-        A decorator function that marks the method as an endpoint.
+        A decorator function that marks the method as an endpoint. The method
+        itself is returned unchanged, so no wrapper is added to the call path.
     """
 
     def decorator(method: Callable) -> Callable:
-        @functools.wraps(method)
-        def wrapper(*args, **kwargs):
-            return method(*args, **kwargs)
-
-        wrapper._jlserve_endpoint = True
-        wrapper._jlserve_endpoint_path = path if path else f"/{method.__name__}"
-        return wrapper
+        method._jlserve_endpoint = True
+        method._jlserve_endpoint_path = sys.intern(path if path else f"/{method.__name__}")
+        # How the route is listed in the startup banner
+        method._jlserve_route_label = f"POST {method._jlserve_endpoint_path}"
+        method._jlserve_trusted_output = trusted_output
+        method._jlserve_blocking = blocking
+        _resolve_endpoint_meta(method)
+        return method
 
     return decorator
 
 
+def _resolve_endpoint_meta(method: Callable) -> None:
+    """Store the method's EndpointMeta on it as ``_jlserve_meta``.
+
+    Doing this once at decoration time means building the server only reads
+    attributes. Annotations that cannot be resolved yet, such as forward
+    references to models defined later in the module, are left for the
+    validator to resolve (and report) when the app is built.
+    """
+    try:
+        method._jlserve_meta = _inspect_endpoint(method)
+    except Exception:
+        pass
+
+
+def _inspect_endpoint(method: Callable) -> EndpointMeta:
+    """Resolve a method's type hints and the name of its input parameter."""
+    # Endpoint annotations are usually plain classes, which get_type_hints
+    # would return unchanged; it is only needed to evaluate string (forward
+    # reference) or other non-class annotations
+    hints = dict(getattr(method, "__annotations__", {}))
+    if not all(isinstance(hint, type) for hint in hints.values()):
+        hints = get_type_hints(method)
+    params = iter(inspect.signature(method).parameters)
+    next(params, None)
+    input_param = next(params, None)
+    return EndpointMeta(
+        input_param=input_param,
+        input_type=hints.get(input_param),
+        output_type=hints.get("return"),
+    )
+
+
 def get_registered_app() -> Optional[Type]:
     """Return the registered app class, or None if no app is registered."""
     return _registered_app
 
 
-def get_endpoint_methods(cls: Type) -> list[Callable]:
+def get_endpoint_methods(cls: Type) -> tuple[Callable, ...]:
     """Retrieve all endpoint-decorated methods from an app class.
 
+    The tuple is built once by @app() at class-decoration time. Classes that
+    were not decorated (including subclasses of an app class) are scanned
+    on first use and the result is cached on the class itself.
+
     Args:
         cls: The app class to inspect.
 
     Returns:
-        A list of methods that are decorated with @endpoint().
+        A tuple of methods decorated with @endpoint(), in definition order.
+        The tuple built by @app() is shared, so callers never need to copy it.
     """
-    methods = []
-    for attr_name in dir(cls):
-        attr = getattr(cls, attr_name)
-        if callable(attr) and getattr(attr, "_jlserve_endpoint", False):
-            methods.append(attr)
+    methods = vars(cls).get("_jlserve_endpoint_methods")
+    if methods is None:
+        methods = _collect_endpoint_methods(cls)
+        cls._jlserve_endpoint_methods = methods
     return methods
 
 
+def _has_setup(cls: Type) -> bool:
+    """Check whether an app class defines a callable setup().
+
+    Like get_endpoint_methods, this reads the flag @app() stored on the
+    class itself; classes that were not decorated (including subclasses of
+    an app class, which may add their own setup()) are checked on first use.
+    """
+    has_setup = vars(cls).get("_jlserve_has_setup")
+    if has_setup is None:
+        has_setup = callable(getattr(cls, "setup", None))
+        cls._jlserve_has_setup = has_setup
+    return has_setup
+
+
+def _collect_endpoint_methods(cls: Type) -> tuple[Callable, ...]:
+    """Scan the class namespaces once for endpoint-decorated methods.
+
+    Walks the MRO from base to subclass so that overrides win, reading each
+    class __dict__ directly instead of resolving every attribute via dir().
+    """
+    endpoints = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for attr_name, attr in vars(klass).items():
+            if callable(attr) and getattr(attr, "_jlserve_endpoint", False):
+                endpoints[attr_name] = attr
+            else:
+                endpoints.pop(attr_name, None)
+    return tuple(endpoints.values())
+
+
 def _reset_registry() -> None:
     """Clear the registered app. For testing only."""
     global _registered_app
@@ -1,9 +1,16 @@
 """Unit tests for the app and endpoint decorators."""
 
+import functools
+
 import pytest
 
 import jlserve
-from jlserve.decorator import _reset_registry, get_endpoint_methods, get_registered_app
+from jlserve.decorator import (
+    EndpointMeta,
+    _reset_registry,
+    get_endpoint_methods,
+    get_registered_app,
+)
 from jlserve.exceptions import MultipleAppsError
 
 
@@ -12,8 +19,6 @@ class TestAppDecorator:
 
     def test_app_decorator_sets_jlserve_app_flag(self):
         """Test that the decorator sets _jlserve_app on the class."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             pass
@@ -23,8 +28,6 @@ class TestAppDecorator:
 
     def test_app_decorator_sets_default_name(self):
         """Test that the decorator sets _jlserve_app_name to class name by default."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             pass
@@ -34,8 +37,6 @@ class TestAppDecorator:
 
     def test_app_decorator_with_custom_name(self):
         """Test that the decorator accepts a custom name."""
-        _reset_registry()
-
         @jlserve.app(name="CustomName")
         class MyApp:
             pass
@@ -44,8 +45,6 @@ class TestAppDecorator:
 
     def test_app_decorator_registers_class(self):
         """Test that the decorator registers the class."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             pass
@@ -55,8 +54,6 @@ class TestAppDecorator:
 
     def test_multiple_apps_raises_error(self):
         """Test that multiple apps raise MultipleAppsError."""
-        _reset_registry()
-
         @jlserve.app()
         class FirstApp:
             pass
@@ -70,10 +67,21 @@ class TestAppDecorator:
         assert "FirstApp" in str(exc_info.value)
         assert "SecondApp" in str(exc_info.value)
 
+    def test_rejected_app_does_not_replace_registered_app(self):
+        """Test that a rejected second app leaves the first one registered."""
+        @jlserve.app()
+        class FirstApp:
+            pass
+
+        with pytest.raises(MultipleAppsError):
+            @jlserve.app()
+            class SecondApp:
+                pass
+
+        assert get_registered_app() is FirstApp
+
     def test_app_decorator_returns_original_class(self):
         """Test that the decorator returns the original class unchanged."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             def helper(self):
@@ -84,8 +92,6 @@ class TestAppDecorator:
 
     def test_app_decorator_with_requirements(self):
         """Test that the decorator accepts and stores requirements."""
-        _reset_registry()
-
         @jlserve.app(requirements=["torch", "transformers==4.35.0", "numpy>=1.24"])
         class MyApp:
             pass
@@ -95,8 +101,6 @@ class TestAppDecorator:
 
     def test_app_decorator_with_empty_requirements(self):
         """Test that the decorator handles empty requirements list."""
-        _reset_registry()
-
         @jlserve.app(requirements=[])
         class MyApp:
             pass
@@ -106,8 +110,6 @@ class TestAppDecorator:
 
     def test_app_decorator_without_requirements(self):
         """Test that the decorator sets empty list when requirements not provided."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             pass
@@ -115,10 +117,37 @@ class TestAppDecorator:
         assert hasattr(MyApp, "_jlserve_requirements")
         assert MyApp._jlserve_requirements == []
 
+    def test_app_decorator_detects_setup_method(self):
+        """Test that the decorator records whether the class defines setup()."""
+        @jlserve.app()
+        class MyApp:
+            def setup(self):
+                pass
+
+        assert MyApp._jlserve_has_setup is True
+
+    def test_app_decorator_detects_inherited_setup_method(self):
+        """Test that a setup() inherited from a base class is detected."""
+        class Base:
+            def setup(self):
+                pass
+
+        @jlserve.app()
+        class MyApp(Base):
+            pass
+
+        assert MyApp._jlserve_has_setup is True
+
+    def test_app_decorator_without_setup_method(self):
+        """Test that classes without a callable setup are not flagged."""
+        @jlserve.app()
+        class MyApp:
+            setup = "not callable"
+
+        assert MyApp._jlserve_has_setup is False
+
     def test_app_decorator_with_various_version_specifiers(self):
         """Test that the decorator accepts various pip version specifier formats."""
-        _reset_registry()
-
         @jlserve.app(
             requirements=[
                 "torch",  # No version
@@ -139,8 +168,6 @@ class TestAppDecorator:
 
     def test_app_decorator_requirements_not_list_raises_error(self):
         """Test that non-list requirements raises ValueError."""
-        _reset_registry()
-
         with pytest.raises(ValueError) as exc_info:
             @jlserve.app(requirements="torch")
             class MyApp:
@@ -151,8 +178,6 @@ class TestAppDecorator:
 
     def test_app_decorator_requirements_with_non_string_raises_error(self):
         """Test that non-string items in requirements raises ValueError."""
-        _reset_registry()
-
         with pytest.raises(ValueError) as exc_info:
             @jlserve.app(requirements=["torch", 123, "numpy"])
             class MyApp:
@@ -163,8 +188,6 @@ class TestAppDecorator:
 
     def test_app_decorator_requirements_with_empty_string_raises_error(self):
         """Test that empty string in requirements raises ValueError."""
-        _reset_registry()
-
         with pytest.raises(ValueError) as exc_info:
             @jlserve.app(requirements=["torch", "", "numpy"])
             class MyApp:
@@ -174,8 +197,6 @@ class TestAppDecorator:
 
     def test_app_decorator_requirements_with_whitespace_only_raises_error(self):
         """Test that whitespace-only string in requirements raises ValueError."""
-        _reset_registry()
-
         with pytest.raises(ValueError) as exc_info:
             @jlserve.app(requirements=["torch", "   ", "numpy"])
             class MyApp:
@@ -189,8 +210,6 @@ class TestEndpointDecorator:
 
     def test_endpoint_decorator_sets_flag(self):
         """Test that the decorator sets _jlserve_endpoint on the method."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -203,8 +222,6 @@ class TestEndpointDecorator:
 
     def test_endpoint_decorator_default_path(self):
         """Test that the decorator sets default path from method name."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -216,8 +233,6 @@ class TestEndpointDecorator:
 
     def test_endpoint_decorator_custom_path(self):
         """Test that the decorator accepts a custom path."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint(path="/custom-path")
@@ -227,10 +242,75 @@ class TestEndpointDecorator:
         methods = get_endpoint_methods(MyApp)
         assert methods[0]._jlserve_endpoint_path == "/custom-path"
 
+    def test_endpoint_decorator_route_label(self):
+        """Test that the route label for the startup banner is set at decoration."""
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint(path="/custom-path")
+            def my_method(self):
+                pass
+
+        methods = get_endpoint_methods(MyApp)
+        assert methods[0]._jlserve_route_label == "POST /custom-path"
+
+    def test_endpoint_decorator_trusted_output(self):
+        """Test that trusted_output is recorded on the method and defaults to False."""
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def checked(self):
+                pass
+
+            @jlserve.endpoint(trusted_output=True)
+            def trusted(self):
+                pass
+
+        checked, trusted = get_endpoint_methods(MyApp)
+        assert checked._jlserve_trusted_output is False
+        assert trusted._jlserve_trusted_output is True
+
+    def test_endpoint_decorator_reads_class_annotations_directly(self, monkeypatch):
+        """Test that plain class annotations are stored without calling get_type_hints."""
+        from jlserve import decorator
+
+        def fail(obj):
+            raise AssertionError("get_type_hints should not be needed")
+
+        monkeypatch.setattr(decorator, "get_type_hints", fail)
+
+        @jlserve.endpoint()
+        def my_method(self, input: int) -> str:
+            pass
+
+        assert my_method._jlserve_meta == EndpointMeta("input", int, str)
+
+    def test_endpoint_decorator_resolves_string_annotations(self):
+        """Test that string annotations are evaluated via get_type_hints."""
+
+        @jlserve.endpoint()
+        def my_method(self, input: "int") -> "str":
+            pass
+
+        assert my_method._jlserve_meta == EndpointMeta("input", int, str)
+
+    def test_endpoint_decorator_blocking_defaults_to_true(self):
+        """Test that endpoints are treated as blocking unless declared otherwise."""
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def slow(self):
+                pass
+
+            @jlserve.endpoint(blocking=False)
+            def quick(self):
+                pass
+
+        slow, quick = get_endpoint_methods(MyApp)
+        assert slow._jlserve_blocking is True
+        assert quick._jlserve_blocking is False
+
     def test_multiple_endpoint_methods(self):
         """Test that multiple methods can be decorated as endpoints."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -252,9 +332,7 @@ class TestEndpointDecorator:
         assert paths == {"/add", "/subtract", "/mult"}
 
     def test_endpoint_preserves_method_name(self):
-        """Test that functools.wraps preserves method name."""
-        _reset_registry()
-
+        """Test that the decorated method keeps its name."""
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -265,9 +343,7 @@ class TestEndpointDecorator:
         assert methods[0].__name__ == "my_endpoint"
 
     def test_endpoint_preserves_docstring(self):
-        """Test that functools.wraps preserves docstring."""
-        _reset_registry()
-
+        """Test that the decorated method keeps its docstring."""
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -280,8 +356,6 @@ class TestEndpointDecorator:
 
     def test_non_endpoint_methods_not_included(self):
         """Test that non-decorated methods are not included."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -298,14 +372,117 @@ class TestEndpointDecorator:
         assert len(methods) == 1
         assert methods[0].__name__ == "endpoint_method"
 
+    def test_endpoint_methods_in_definition_order(self):
+        """Test that endpoints are returned in class definition order."""
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def subtract(self):
+                pass
+
+            @jlserve.endpoint()
+            def add(self):
+                pass
+
+        methods = get_endpoint_methods(MyApp)
+        assert [m.__name__ for m in methods] == ["subtract", "add"]
+
+    def test_inherited_endpoint_methods_included(self):
+        """Test that endpoints defined on a base class are collected."""
+        class Base:
+            @jlserve.endpoint()
+            def add(self):
+                pass
+
+        @jlserve.app()
+        class MyApp(Base):
+            @jlserve.endpoint()
+            def subtract(self):
+                pass
+
+        methods = get_endpoint_methods(MyApp)
+        assert {m.__name__ for m in methods} == {"add", "subtract"}
+
+    def test_undecorated_class_is_scanned(self):
+        """Test that endpoints are found on classes without @jlserve.app()."""
+
+        class NotAnApp:
+            @jlserve.endpoint()
+            def add(self):
+                pass
+
+            def helper(self):
+                pass
+
+        methods = get_endpoint_methods(NotAnApp)
+        assert [m.__name__ for m in methods] == ["add"]
+
+    def test_subclass_of_app_does_not_reuse_parent_list(self):
+        """Test that a subclass sees its own endpoints, not the parent's cached list."""
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def add(self):
+                pass
+
+        class Extended(MyApp):
+            @jlserve.endpoint()
+            def subtract(self):
+                pass
+
+        methods = get_endpoint_methods(Extended)
+        assert {m.__name__ for m in methods} == {"add", "subtract"}
+
+    def test_endpoint_under_wrapping_decorator_is_collected(self):
+        """Test that endpoints wrapped by another decorator are still found."""
+        def logged(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @jlserve.app()
+        class MyApp:
+            @logged
+            @jlserve.endpoint()
+            def add(self):
+                pass
+
+        methods = get_endpoint_methods(MyApp)
+        assert len(methods) == 1
+        assert methods[0]._jlserve_endpoint_path == "/add"
+
+    def test_scan_result_cached_on_undecorated_class(self):
+        """Test that scanning an undecorated class happens only once."""
+
+        class NotAnApp:
+            @jlserve.endpoint()
+            def add(self):
+                pass
+
+        methods = get_endpoint_methods(NotAnApp)
+        assert vars(NotAnApp)["_jlserve_endpoint_methods"] is methods
+        assert get_endpoint_methods(NotAnApp) is methods
+
+    def test_endpoint_methods_returns_shared_tuple(self):
+        """Test that repeated lookups return the same immutable tuple."""
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def add(self):
+                pass
+
+        methods = get_endpoint_methods(MyApp)
+        assert isinstance(methods, tuple)
+        assert get_endpoint_methods(MyApp) is methods
+
 
 class TestResetRegistry:
     """Tests for the _reset_registry function."""
 
     def test_reset_registry_clears_app(self):
         """Test that _reset_registry clears the registered app."""
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             pass
@@ -1,5 +1,8 @@
 """Custom exception classes for JLServe."""
 
+import enum
+from typing import Optional
+
 
 class JLServeError(Exception):
     """Base exception for all JLServe errors."""
@@ -7,10 +10,31 @@ class JLServeError(Exception):
     pass
 
 
+class ErrorCode(enum.Enum):
+    """Identifies the check an EndpointValidationError comes from."""
+
+    NOT_DECORATED = "not_decorated"
+    NO_ENDPOINTS = "no_endpoints"
+    MISSING_INPUT_PARAMETER = "missing_input_parameter"
+    MISSING_INPUT_HINT = "missing_input_hint"
+    MISSING_RETURN_HINT = "missing_return_hint"
+    INVALID_INPUT_TYPE = "invalid_input_type"
+    INVALID_OUTPUT_TYPE = "invalid_output_type"
+    MIXED_IO_TYPES = "mixed_io_types"
+    DUPLICATE_PATH = "duplicate_path"
+
+
 class EndpointValidationError(JLServeError):
-    """Raised when an endpoint class fails validation."""
+    """Raised when an endpoint class fails validation.
 
-    pass
+    Attributes:
+        code: The ErrorCode of the failed check, so callers can tell failures
+            apart without parsing the message.
+    """
+
+    def __init__(self, message: str, code: Optional[ErrorCode] = None):
+        super().__init__(message)
+        self.code = code
 
 
 class EndpointSetupError(JLServeError):
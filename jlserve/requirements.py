@@ -23,10 +23,14 @@ def extract_requirements_from_file(file_path: str) -> list[str]:
         FileNotFoundError: If the file doesn't exist.
         SyntaxError: If the file contains invalid Python syntax.
     """
-    source = Path(file_path).read_text()
-    tree = ast.parse(source)
-
-    for node in ast.walk(tree):
+    # Hand the parser raw bytes: it honours PEP 263 encoding declarations
+    # itself, and no separate decode pass is needed
+    source = Path(file_path).read_bytes()
+    tree = ast.parse(source, filename=file_path)
+
+    # @jlserve.app() classes live at module level, so only top-level
+    # statements are scanned rather than walking every node in the tree
+    for node in tree.body:
         if isinstance(node, ast.ClassDef):
             for decorator in node.decorator_list:
                 if _is_jlserve_app_decorator(decorator):
@@ -293,3 +293,46 @@ class MyModel:
             assert requirements == ["torch"]
         finally:
             Path(temp_path).unlink()
+
+    def test_extract_requirements_ignores_nested_classes(self):
+        """Test that only module-level @jlserve.app() classes are considered."""
+        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
+            f.write("""
+import jlserve
+
+def factory():
+    @jlserve.app(requirements=["nested"])
+    class Nested:
+        pass
+    return Nested
+
+@jlserve.app(requirements=["torch"])
+class MyModel:
+    pass
+""")
+            temp_path = f.name
+
+        try:
+            requirements = extract_requirements_from_file(temp_path)
+            assert requirements == ["torch"]
+        finally:
+            Path(temp_path).unlink()
+
+    def test_extract_requirements_honours_encoding_declaration(self):
+        """Test that files with a PEP 263 encoding declaration are parsed correctly."""
+        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="wb") as f:
+            f.write(
+                "# -*- coding: latin-1 -*-\n"
+                "import jlserve\n"
+                "\n"
+                "@jlserve.app(requirements=['café-lib'])\n"
+                "class MyModel:\n"
+                "    pass\n".encode("latin-1")
+            )
+            temp_path = f.name
+
+        try:
+            requirements = extract_requirements_from_file(temp_path)
+            assert requirements == ["café-lib"]
+        finally:
+            Path(temp_path).unlink()
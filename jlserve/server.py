@@ -1,84 +1,421 @@
 """FastAPI server integration for JLServe apps."""
 
+import asyncio
+import functools
+import inspect
+import re
 from contextlib import asynccontextmanager
-from typing import Callable, Type
+from typing import Awaitable, Callable, Optional, Type
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
 
-from jlserve.decorator import get_endpoint_methods
+from jlserve.decorator import _has_setup, get_endpoint_methods
 from jlserve.exceptions import EndpointSetupError
-from jlserve.validator import get_method_input_type, get_method_output_type, validate_app
+from jlserve.validator import (
+    _is_msgspec_struct,
+    get_method_input_type,
+    get_method_output_construct,
+    get_method_output_type,
+    validate_app,
+)
 
+_STATUS_OK = b'{"status":"ok"}'
+_STATUS_STARTING = b'{"status":"starting"}'
 
-def create_app(app_cls: Type) -> FastAPI:
+# Building a TypeAdapter compiles a validator and serializer for the type, so
+# endpoints sharing an output model share one adapter
+_type_adapter = functools.lru_cache(maxsize=256)(TypeAdapter)
+
+
+def create_app(app_cls: Type, port: Optional[int] = None, profile: bool = False) -> FastAPI:
     """Create a FastAPI app from a JLServe app class.
 
+    Besides the endpoint routes, the app exposes GET /health/live (always 200)
+    and GET /health/ready (503 until setup() has completed).
+
+    The app class is instantiated and its setup() called by the app's
+    lifespan, i.e. when the server starts; errors there, wrapped in
+    EndpointSetupError, are raised at startup rather than from create_app.
+    Until then, endpoints answer 503 ``{"status": "starting"}``, as they do
+    when the lifespan never runs (e.g. for an app mounted under another one).
+
     Args:
         app_cls: The app class decorated with @jlserve.app().
+        port: Optional port the app will be served on. When given, a startup
+            banner is printed once setup() has completed.
+        profile: If True, requests made with a ``?profile=1`` query parameter
+            are profiled with pyinstrument and answered with the HTML report
+            instead of the endpoint's response. Requires the optional
+            pyinstrument dependency.
 
     Returns:
         A configured FastAPI application with routes for all endpoints.
 
     Raises:
         EndpointValidationError: If the app class is invalid.
-        EndpointSetupError: If the setup() method fails.
+        ImportError: If profile is True and pyinstrument is not installed.
     """
     validate_app(app_cls)
 
     app_name = getattr(app_cls, "_jlserve_app_name", "app")
     endpoint_methods = get_endpoint_methods(app_cls)
+    has_setup = _has_setup(app_cls)
 
-    # Create the app instance once - shared across all endpoints
-    app_instance = app_cls()
+    # Endpoint methods bound to the shared app instance, keyed by path. The
+    # instance is only created when the server starts, so heavy __init__
+    # work never runs for apps that are built but not served.
+    bound_methods: dict[str, Callable] = {}
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
-        # Call setup() if it exists
-        if hasattr(app_instance, "setup") and callable(app_instance.setup):
+        # Create the app instance once - shared across all endpoints
+        try:
+            app_instance = app_cls()
+        except Exception as e:
+            raise EndpointSetupError(f"{app_cls.__name__}() failed: {e}") from e
+
+        for method in endpoint_methods:
+            bound_methods[method._jlserve_endpoint_path] = method.__get__(app_instance, app_cls)
+        app.state.app_instance = app_instance
+
+        # Call setup() if it exists, building the OpenAPI schema on a worker
+        # thread meanwhile so the first /docs request finds it cached. setup()
+        # itself stays on the event loop thread, so thread-local state and
+        # calls such as signal.signal() behave as in any startup code.
+        if has_setup:
+            warm_schema = asyncio.get_running_loop().run_in_executor(
+                None, _warm_openapi_schema, app
+            )
             try:
                 app_instance.setup()
             except Exception as e:
                 raise EndpointSetupError(f"setup() failed: {e}") from e
+            finally:
+                await warm_schema
+
+        app.state.ready = True
+        if port is not None:
+            _print_startup_banner(app_name, port, endpoint_methods)
 
         yield
 
+    # No custom default_response_class: endpoint routes write JSON bytes
+    # produced by pydantic-core (or msgspec) themselves, so a response class
+    # such as ORJSONResponse would have nothing left to speed up
     fastapi_app = FastAPI(title=app_name, lifespan=lifespan)
+    fastapi_app.state.ready = False
+    fastapi_app.add_exception_handler(Exception, _handle_endpoint_error)
+
+    # Probe bodies are constant, so they are encoded once rather than run
+    # through FastAPI's jsonable_encoder on every poll
+    async def health_live(request: Request) -> Response:
+        return Response(_STATUS_OK, media_type="application/json")
+
+    async def health_ready(request: Request) -> Response:
+        if not fastapi_app.state.ready:
+            return _starting_response()
+        return Response(_STATUS_OK, media_type="application/json")
+
+    for probe_path, probe in (("/health/live", health_live), ("/health/ready", health_ready)):
+        fastapi_app.router.add_api_route(
+            probe_path,
+            probe,
+            methods=["GET"],
+            include_in_schema=False,
+            route_class_override=_RequestRoute,
+        )
 
     # Register a POST route for each endpoint method
     for method in endpoint_methods:
-        _register_endpoint_route(fastapi_app, method, app_instance)
+        _register_endpoint_route(fastapi_app, method, bound_methods)
+
+    if profile:
+        _add_profiling_middleware(fastapi_app)
 
     return fastapi_app
 
 
-def _register_endpoint_route(fastapi_app: FastAPI, method: Callable, app_instance: object) -> None:
+def _starting_response() -> Response:
+    """The 503 response for requests that arrive before setup() has completed."""
+    return Response(_STATUS_STARTING, status_code=503, media_type="application/json")
+
+
+async def _handle_endpoint_error(request: Request, exc: Exception) -> JSONResponse:
+    """Turn an unhandled endpoint exception into a 500 response with its message."""
+    return JSONResponse(status_code=500, content={"detail": str(exc)})
+
+
+def _add_profiling_middleware(app: FastAPI) -> None:
+    """Profile requests made with ?profile=1 and return the report as HTML.
+
+    Other requests pass straight through to the app.
+
+    Raises:
+        ImportError: If pyinstrument is not installed.
+    """
+    from fastapi.responses import HTMLResponse
+
+    try:
+        from pyinstrument import Profiler
+    except ImportError as e:
+        raise ImportError(
+            "Profiling requires pyinstrument. Install it with: pip install jlserve[profile]"
+        ) from e
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        if request.query_params.get("profile") != "1":
+            return await call_next(request)
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            await call_next(request)
+        finally:
+            # Uninstall the profiler hook even if the endpoint raised
+            profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+
+def _warm_openapi_schema(app: FastAPI) -> None:
+    """Build and cache the app's OpenAPI schema, ignoring any errors.
+
+    A failure here is not a startup failure; it resurfaces when
+    /openapi.json is requested.
+    """
+    try:
+        app.openapi()
+    except Exception:
+        pass
+
+
+def _print_startup_banner(app_name: str, port: int, endpoint_methods: tuple[Callable, ...]) -> None:
+    """Print where the app is being served and which endpoints it exposes."""
+    routes = ", ".join(m._jlserve_route_label for m in endpoint_methods)
+    # One write, so the banner is not interleaved with uvicorn's log lines
+    print(
+        f"\nServing {app_name} at http://localhost:{port}\n"
+        f"Docs at http://localhost:{port}/docs\n\n"
+        f"Endpoints: {routes}\n",
+        flush=True,
+    )
+
+
+def _ensure_model_built(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Finish building a model declared with ``defer_build=True``.
+
+    Deferred models skip schema construction at import time; the build is
+    completed here, when the app is actually being served, so FastAPI sees
+    a fully built model and the first request doesn't pay for compiling its
+    validator and serializer. Models that are already complete are left
+    alone; forcing a rebuild would only repeat that work.
+    """
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+    return model
+
+
+def _register_endpoint_route(
+    fastapi_app: FastAPI, method: Callable, bound_methods: dict[str, Callable]
+) -> None:
     """Register a POST route for an endpoint method.
 
     Args:
         fastapi_app: The FastAPI application to register the route on.
         method: The endpoint method to create a route for.
-        app_instance: The shared app instance to call methods on.
+        bound_methods: Endpoint methods bound to the shared app instance,
+            keyed by path. Filled in by the lifespan at startup.
     """
     path = method._jlserve_endpoint_path
     input_type = get_method_input_type(method)
-    output_type = get_method_output_type(method)
-    method_name = method.__name__
 
-    # Create the route handler
-    # We need to capture method_name and app_instance in closure
-    def create_handler(captured_method_name: str, captured_instance: object):
+    if _is_msgspec_struct(input_type):
+        _register_struct_route(fastapi_app, path, method, bound_methods, input_type)
+        return
+
+    input_type = _ensure_model_built(input_type)
+    output_type = _ensure_model_built(get_method_output_type(method))
+
+    # Pick the dispatch strategy once: coroutine endpoints are awaited on the
+    # event loop, plain methods run in the threadpool so a slow model call
+    # doesn't block other requests, unless declared with blocking=False.
+    # Errors are turned into 500 responses by the app-wide exception handler.
+    if inspect.iscoroutinefunction(method):
+
         async def handler(input_data: input_type) -> output_type:
-            """Handle incoming requests by calling the endpoint method."""
-            endpoint_method = getattr(captured_instance, captured_method_name)
+            """Handle incoming requests by awaiting the endpoint coroutine."""
+            return await bound_methods[path](input_data)
+
+    elif not method._jlserve_blocking:
+
+        async def handler(input_data: input_type) -> output_type:
+            """Handle incoming requests by calling the endpoint method on the event loop."""
+            return bound_methods[path](input_data)
+
+    else:
+
+        async def handler(input_data: input_type) -> output_type:
+            """Handle incoming requests by calling the endpoint method in the threadpool."""
+            return await run_in_threadpool(bound_methods[path], input_data)
+
+    if method._jlserve_trusted_output:
+        call_endpoint = handler
+        construct = get_method_output_construct(method)
+
+        async def handler(input_data: input_type) -> output_type:
+            """Build dict results with model_construct(), skipping validation."""
+            result = await call_endpoint(input_data)
+            return construct(**result) if isinstance(result, dict) else result
+
+    # Register the route with FastAPI. The request body and response model
+    # come from the handler's annotations and are documented in OpenAPI as
+    # usual; at runtime _ValidatedBodyRoute parses the body itself.
+    fastapi_app.router.add_api_route(
+        path, handler, methods=["POST"], route_class_override=_ValidatedBodyRoute
+    )
+
+
+class _ValidatedBodyRoute(APIRoute):
+    """Route for endpoints that take a single Pydantic model as the request body.
+
+    FastAPI still inspects the handler signature, so OpenAPI describes the
+    body and response models. Requests skip FastAPI's dependency resolution:
+    the raw body bytes go straight to the input model's model_validate_json
+    (no separate json.loads pass), and the result is dumped to JSON bytes by
+    a TypeAdapter shared by all routes returning that model, without
+    FastAPI's response-model validation pass.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        annotations = self.endpoint.__annotations__
+        input_type = annotations["input_data"]
+        output_type = annotations["return"]
+        output_adapter = _type_adapter(output_type)
+
+        # Everything the handler needs is bound as a default argument, so each
+        # lookup is a plain local rather than a closure cell. Starlette only
+        # ever passes the request.
+        async def route_handler(
+            request: Request,
+            _validate_json=input_type.model_validate_json,
+            _validate_result=output_adapter.validate_python,
+            _dump_json=output_adapter.dump_json,
+            _output_type=output_type,
+            _handler=self.endpoint,
+        ) -> Response:
+            # The app instance only exists once the lifespan has run, which
+            # never happens e.g. for an app mounted under another one
+            if not request.app.state.ready:
+                return _starting_response()
+
+            body = await request.body()
             try:
-                return endpoint_method(input_data)
-            except Exception as e:
-                return JSONResponse(
-                    status_code=500,
-                    content={"detail": str(e)},
-                )
-        return handler
-
-    # Register the route with FastAPI
-    fastapi_app.post(path, response_model=output_type)(create_handler(method_name, app_instance))
+                input_data = _validate_json(body)
+            except ValidationError as e:
+                # Same error shape FastAPI produces for an invalid body
+                errors = [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+                raise RequestValidationError(errors, body=body) from e
+
+            # The return type is checked when the app is built, so an instance
+            # of the output model is serialized as is; anything else (e.g. a
+            # dict) is validated into the output model first
+            result = await _handler(input_data)
+            if type(result) is not _output_type:
+                result = _validate_result(result)
+            return Response(_dump_json(result, by_alias=True), media_type="application/json")
+
+        return route_handler
+
+
+class _RequestRoute(APIRoute):
+    """Route whose endpoint takes the Request itself and returns a Response.
+
+    Such an endpoint has nothing for FastAPI to resolve, so it is called
+    directly and FastAPI's per-request dependency solving and response
+    handling are skipped. OpenAPI still reflects the route.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        return self.endpoint
+
+
+def _register_struct_route(
+    fastapi_app: FastAPI,
+    path: str,
+    method: Callable,
+    bound_methods: dict[str, Callable],
+    input_type: type,
+) -> None:
+    """Register a POST route for an endpoint that takes and returns msgspec Structs.
+
+    The request body is decoded and validated by msgspec directly and the
+    result is encoded by msgspec, bypassing FastAPI's body parsing and
+    response serialization. The body schema is not described in OpenAPI.
+
+    Args:
+        fastapi_app: The FastAPI application to register the route on.
+        path: The route path.
+        method: The endpoint method, used to pick how it is dispatched.
+        bound_methods: Endpoint methods bound to the shared app instance, keyed by path.
+        input_type: The msgspec.Struct subclass used as input type.
+    """
+    import msgspec
+
+    decoder = msgspec.json.Decoder(input_type)
+    encoder = msgspec.json.Encoder()
+    is_coroutine = inspect.iscoroutinefunction(method)
+    in_threadpool = not is_coroutine and method._jlserve_blocking
+
+    async def handler(request: Request) -> Response:
+        """Handle incoming requests by decoding the body with msgspec."""
+        if not request.app.state.ready:
+            return _starting_response()
+
+        try:
+            input_data = decoder.decode(await request.body())
+        except msgspec.ValidationError as e:
+            return JSONResponse(status_code=422, content={"detail": _struct_validation_errors(e)})
+        except msgspec.DecodeError as e:
+            return JSONResponse(status_code=400, content={"detail": str(e)})
+
+        if is_coroutine:
+            result = await bound_methods[path](input_data)
+        elif in_threadpool:
+            result = await run_in_threadpool(bound_methods[path], input_data)
+        else:
+            result = bound_methods[path](input_data)
+        return Response(encoder.encode(result), media_type="application/json")
+
+    fastapi_app.router.add_api_route(
+        path,
+        handler,
+        methods=["POST"],
+        response_class=Response,
+        route_class_override=_RequestRoute,
+    )
+
+
+_STRUCT_ERROR_PATH = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+
+
+def _struct_validation_errors(error: Exception) -> list[dict]:
+    """Convert a msgspec ValidationError to FastAPI's list-of-errors shape.
+
+    msgspec reports a single error whose message ends with the JSON path of
+    the invalid value, e.g. "Expected `int`, got `str` - at `$.items[0]`".
+    The path becomes the error's loc, as in FastAPI's Pydantic 422 responses.
+    """
+    message, _, path = str(error).partition(" - at `")
+    loc: list = ["body"]
+    for key, index in _STRUCT_ERROR_PATH.findall(path.rstrip("`").removeprefix("$")):
+        loc.append(key if key else int(index))
+    return [{"type": "value_error", "loc": loc, "msg": message}]
+
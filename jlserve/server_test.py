@@ -1,38 +1,24 @@
 """Unit tests for FastAPI server integration with multi-endpoint apps."""
 
+import sys
+import threading
+import warnings
+
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 import jlserve
-from jlserve.decorator import _reset_registry
-from jlserve.exceptions import EndpointSetupError, EndpointValidationError
-from jlserve.server import create_app
-
-
-class Input(BaseModel):
-    value: int
-
-
-class Output(BaseModel):
-    result: int
-
-
-class TwoNumbers(BaseModel):
-    a: int
-    b: int
-
-
-class Result(BaseModel):
-    result: int
+from jlserve._test_models import Input, Output, Result, TwoNumbers
+from jlserve.exceptions import EndpointSetupError, EndpointValidationError, ErrorCode
+from jlserve.server import _struct_validation_errors, _type_adapter, create_app
 
 
 class TestCreateApp:
-    """Tests for creating FastAPI apps from Jarvis app classes."""
+    """Tests for creating FastAPI apps from JLServe app classes."""
 
     def test_creates_fastapi_app(self):
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -43,8 +29,6 @@ class TestCreateApp:
         assert app is not None
 
     def test_uses_app_name_as_title(self):
-        _reset_registry()
-
         @jlserve.app(name="Calculator")
         class MyApp:
             @jlserve.endpoint()
@@ -55,8 +39,6 @@ class TestCreateApp:
         assert app.title == "Calculator"
 
     def test_uses_class_name_as_default_title(self):
-        _reset_registry()
-
         @jlserve.app()
         class MyCalculator:
             @jlserve.endpoint()
@@ -77,20 +59,8 @@ class TestCreateApp:
 class TestMultiRouteRegistration:
     """Tests for registering multiple endpoint routes."""
 
-    def test_registers_multiple_routes(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class Calculator:
-            @jlserve.endpoint()
-            def add(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a + input.b)
-
-            @jlserve.endpoint()
-            def subtract(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a - input.b)
-
-        app = create_app(Calculator)
+    def test_registers_multiple_routes(self, calculator_client):
+        app = calculator_client.app
 
         # Check routes are registered
         paths = [route.path for route in app.routes if hasattr(route, "path")]
@@ -98,8 +68,6 @@ class TestMultiRouteRegistration:
         assert "/subtract" in paths
 
     def test_custom_paths_registered(self):
-        _reset_registry()
-
         @jlserve.app()
         class Calculator:
             @jlserve.endpoint(path="/plus")
@@ -118,17 +86,56 @@ class TestMultiRouteRegistration:
         assert "/add" not in paths
         assert "/subtract" not in paths
 
+    def test_routes_share_output_adapter(self):
+        class Shared(BaseModel):
+            result: int
+
+        @jlserve.app()
+        class Calculator:
+            @jlserve.endpoint()
+            def add(self, input: TwoNumbers) -> Shared:
+                return Shared(result=input.a + input.b)
+
+            @jlserve.endpoint()
+            def subtract(self, input: TwoNumbers) -> Shared:
+                return Shared(result=input.a - input.b)
+
+        before = _type_adapter.cache_info()
+        create_app(Calculator)
+        after = _type_adapter.cache_info()
+
+        assert after.misses - before.misses == 1
+        assert after.hits - before.hits == 1
+
 
 class TestEndpointRoutes:
     """Tests for endpoint route functionality."""
 
-    def test_post_to_add_endpoint(self):
-        _reset_registry()
+    def test_post_to_add_endpoint(self, calculator_client):
+        response = calculator_client.post("/add", json={"a": 5, "b": 3})
+        assert response.status_code == 200
+        assert response.json() == {"result": 8}
+
+    def test_post_to_subtract_endpoint(self, calculator_client):
+        response = calculator_client.post("/subtract", json={"a": 10, "b": 4})
+        assert response.status_code == 200
+        assert response.json() == {"result": 6}
+
+    def test_multiple_endpoints_work_together(self, calculator_client):
+        client = calculator_client
+        assert client.post("/add", json={"a": 2, "b": 3}).json() == {"result": 5}
+        assert client.post("/subtract", json={"a": 5, "b": 2}).json() == {"result": 3}
+        assert client.post("/multiply", json={"a": 4, "b": 3}).json() == {"result": 12}
+
+    def test_invalid_input_returns_422(self, calculator_client):
+        response = calculator_client.post("/add", json={"wrong_field": "value"})
+        assert response.status_code == 422
 
+    def test_async_endpoint(self):
         @jlserve.app()
         class Calculator:
             @jlserve.endpoint()
-            def add(self, input: TwoNumbers) -> Result:
+            async def add(self, input: TwoNumbers) -> Result:
                 return Result(result=input.a + input.b)
 
         app = create_app(Calculator)
@@ -137,65 +144,102 @@ class TestEndpointRoutes:
             assert response.status_code == 200
             assert response.json() == {"result": 8}
 
-    def test_post_to_subtract_endpoint(self):
-        _reset_registry()
+    def test_sync_endpoint_runs_off_the_event_loop(self):
+        threads = {}
 
         @jlserve.app()
-        class Calculator:
+        class MyApp:
             @jlserve.endpoint()
-            def subtract(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a - input.b)
+            def blocking(self, input: Input) -> Output:
+                threads["sync"] = threading.get_ident()
+                return Output(result=input.value)
 
-        app = create_app(Calculator)
+            @jlserve.endpoint()
+            async def non_blocking(self, input: Input) -> Output:
+                threads["async"] = threading.get_ident()
+                return Output(result=input.value)
+
+        app = create_app(MyApp)
         with TestClient(app) as client:
-            response = client.post("/subtract", json={"a": 10, "b": 4})
-            assert response.status_code == 200
-            assert response.json() == {"result": 6}
+            client.post("/blocking", json={"value": 1})
+            client.post("/non_blocking", json={"value": 1})
 
-    def test_multiple_endpoints_work_together(self):
-        _reset_registry()
+        assert threads["sync"] != threads["async"]
+
+    def test_non_blocking_sync_endpoint_runs_on_the_event_loop(self):
+        threads = {}
 
         @jlserve.app()
-        class Calculator:
-            @jlserve.endpoint()
-            def add(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a + input.b)
+        class MyApp:
+            @jlserve.endpoint(blocking=False)
+            def quick(self, input: Input) -> Output:
+                threads["sync"] = threading.get_ident()
+                return Output(result=input.value)
 
             @jlserve.endpoint()
-            def subtract(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a - input.b)
+            async def non_blocking(self, input: Input) -> Output:
+                threads["async"] = threading.get_ident()
+                return Output(result=input.value)
 
+        app = create_app(MyApp)
+        with TestClient(app) as client:
+            assert client.post("/quick", json={"value": 3}).json() == {"result": 3}
+            client.post("/non_blocking", json={"value": 1})
+
+        assert threads["sync"] == threads["async"]
+
+    def test_endpoint_can_return_ok_dict(self):
+        @jlserve.app()
+        class MyApp:
             @jlserve.endpoint()
-            def multiply(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a * input.b)
+            def add_one(self, input: Input) -> Output:
+                return jlserve.ok(result=input.value + 1)
 
-        app = create_app(Calculator)
+        app = create_app(MyApp)
         with TestClient(app) as client:
-            assert client.post("/add", json={"a": 2, "b": 3}).json() == {"result": 5}
-            assert client.post("/subtract", json={"a": 5, "b": 2}).json() == {"result": 3}
-            assert client.post("/multiply", json={"a": 4, "b": 3}).json() == {"result": 12}
-
-    def test_invalid_input_returns_422(self):
-        _reset_registry()
+            response = client.post("/add_one", json={"value": 1})
+            assert response.status_code == 200
+            assert response.json() == {"result": 2}
 
+    def test_ok_dict_not_matching_output_returns_500(self):
         @jlserve.app()
-        class Calculator:
+        class MyApp:
             @jlserve.endpoint()
-            def add(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a + input.b)
+            def broken(self, input: Input) -> Output:
+                return jlserve.ok(wrong=input.value)
 
-        app = create_app(Calculator)
+        app = create_app(MyApp)
+        with TestClient(app, raise_server_exceptions=False) as client:
+            response = client.post("/broken", json={"value": 1})
+            assert response.status_code == 500
+
+    def test_trusted_output_dict_built_with_model_construct(self):
+        constructed = []
+
+        class TrackedOutput(Output):
+            @classmethod
+            def model_construct(cls, *args, **kwargs):
+                constructed.append(kwargs)
+                return super().model_construct(*args, **kwargs)
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint(trusted_output=True)
+            def add_one(self, input: Input) -> TrackedOutput:
+                return {"result": input.value + 1}
+
+        app = create_app(MyApp)
         with TestClient(app) as client:
-            response = client.post("/add", json={"wrong_field": "value"})
-            assert response.status_code == 422
+            response = client.post("/add_one", json={"value": 1})
+            assert response.status_code == 200
+            assert response.json() == {"result": 2}
+        assert constructed == [{"result": 2}]
 
 
 class TestSharedState:
     """Tests for shared state across endpoints."""
 
     def test_shared_instance_across_endpoints(self):
-        _reset_registry()
-
         @jlserve.app()
         class Counter:
             def __init__(self):
@@ -221,8 +265,6 @@ class TestSharedState:
             assert response.json() == {"result": 8}
 
     def test_setup_initializes_shared_state(self):
-        _reset_registry()
-
         @jlserve.app()
         class Calculator:
             def setup(self):
@@ -242,8 +284,6 @@ class TestSetupMethod:
     """Tests for the setup() method lifecycle."""
 
     def test_setup_is_called_on_startup(self):
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             def setup(self):
@@ -259,28 +299,51 @@ class TestSetupMethod:
             response = client.post("/process", json={"value": 42})
             assert response.status_code == 200
 
-    def test_app_without_setup_works(self):
-        _reset_registry()
+    def test_app_without_setup_works(self, process_client):
+        response = process_client.post("/process", json={"value": 5})
+        assert response.status_code == 200
+        assert response.json() == {"result": 5}
 
+    def test_setup_failure_prevents_startup(self):
         @jlserve.app()
         class MyApp:
+            def setup(self):
+                raise RuntimeError("Setup failed!")
+
             @jlserve.endpoint()
             def process(self, input: Input) -> Output:
-                return Output(result=input.value * 2)
+                return Output(result=input.value)
 
         app = create_app(MyApp)
-        with TestClient(app) as client:
-            response = client.post("/process", json={"value": 5})
-            assert response.status_code == 200
-            assert response.json() == {"result": 10}
+        with pytest.raises(EndpointSetupError) as exc_info:
+            with TestClient(app):
+                pass
+        assert "Setup failed!" in str(exc_info.value)
 
-    def test_setup_failure_prevents_startup(self):
-        _reset_registry()
+    def test_instance_created_at_startup_not_at_create_app(self):
+        created = []
 
         @jlserve.app()
         class MyApp:
-            def setup(self):
-                raise RuntimeError("Setup failed!")
+            def __init__(self):
+                created.append(self)
+
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp)
+        assert created == []
+
+        with TestClient(app):
+            assert len(created) == 1
+            assert app.state.app_instance is created[0]
+
+    def test_init_failure_prevents_startup(self):
+        @jlserve.app()
+        class MyApp:
+            def __init__(self):
+                raise RuntimeError("Init failed!")
 
             @jlserve.endpoint()
             def process(self, input: Input) -> Output:
@@ -290,15 +353,80 @@ class TestSetupMethod:
         with pytest.raises(EndpointSetupError) as exc_info:
             with TestClient(app):
                 pass
-        assert "Setup failed!" in str(exc_info.value)
+        assert "Init failed!" in str(exc_info.value)
+
+    def test_setup_runs_on_event_loop_thread(self):
+        @jlserve.app()
+        class MyApp:
+            def setup(self):
+                self.setup_thread = threading.get_ident()
+
+            @jlserve.endpoint()
+            async def process(self, input: Input) -> Output:
+                return Output(result=int(self.setup_thread == threading.get_ident()))
+
+        with TestClient(create_app(MyApp)) as client:
+            assert client.post("/process", json={"value": 1}).json() == {"result": 1}
+
+    def test_setup_added_by_undecorated_subclass_is_called(self):
+        @jlserve.app()
+        class Base:
+            k = 0
+
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=self.k)
+
+        class Sub(Base):
+            def setup(self):
+                self.k = 42
+
+        with TestClient(create_app(Sub)) as client:
+            assert client.post("/process", json={"value": 1}).json() == {"result": 42}
+
+    @pytest.mark.parametrize("mounted", [False, True], ids=["not_started", "mounted"])
+    def test_endpoint_returns_503_without_lifespan(self, mounted):
+        """Without a lifespan there is no app instance yet, so endpoints report starting."""
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp)
+        if mounted:
+            outer = FastAPI()
+            outer.mount("/m", app)
+            client, url = TestClient(outer), "/m/process"
+        else:
+            client, url = TestClient(app), "/process"
+
+        response = client.post(url, json={"value": 1})
+        assert response.status_code == 503
+        assert response.json() == {"status": "starting"}
+
+    def test_openapi_schema_built_during_setup(self):
+        @jlserve.app()
+        class MyApp:
+            def setup(self):
+                self.ready = True
+
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp)
+        assert app.openapi_schema is None
+        with TestClient(app):
+            assert app.openapi_schema is not None
+            assert "/process" in app.openapi_schema["paths"]
 
 
 class TestErrorHandling:
     """Tests for error handling in endpoints."""
 
     def test_exception_in_endpoint_returns_500(self):
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
@@ -306,18 +434,45 @@ class TestErrorHandling:
                 raise ValueError("Something went wrong")
 
         app = create_app(MyApp)
-        with TestClient(app) as client:
+        # The error is still re-raised to the server for logging after the
+        # 500 response has been sent
+        with TestClient(app, raise_server_exceptions=False) as client:
             response = client.post("/failing", json={"value": 1})
             assert response.status_code == 500
             assert "Something went wrong" in response.json()["detail"]
 
+    def test_async_exception_in_endpoint_returns_500(self):
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            async def failing(self, input: Input) -> Output:
+                raise ValueError("Async failure")
+
+        app = create_app(MyApp)
+        with TestClient(app, raise_server_exceptions=False) as client:
+            response = client.post("/failing", json={"value": 1})
+            assert response.status_code == 500
+            assert response.json() == {"detail": "Async failure"}
+
+    def test_invalid_input_still_returns_422(self, process_client):
+        response = process_client.post("/process", json={"value": "not a number"})
+        assert response.status_code == 422
+
+    def test_invalid_input_error_locates_body_field(self, process_client):
+        response = process_client.post("/process", json={"value": "not a number"})
+        assert response.json()["detail"][0]["loc"] == ["body", "value"]
+
+    def test_malformed_json_returns_422(self, process_client):
+        response = process_client.post(
+            "/process", content=b"{not json", headers={"content-type": "application/json"}
+        )
+        assert response.status_code == 422
+
 
 class TestOpenAPIDocs:
     """Tests for OpenAPI documentation."""
 
     def test_openapi_docs_available(self):
-        _reset_registry()
-
         @jlserve.app(name="Calculator")
         class Calculator:
             @jlserve.endpoint()
@@ -330,28 +485,310 @@ class TestOpenAPIDocs:
         response = client.get("/docs")
         assert response.status_code == 200
 
-    def test_openapi_json_has_all_endpoints(self):
-        _reset_registry()
+    def test_openapi_json_has_all_endpoints(self, calculator_client):
+        openapi = calculator_client.app.openapi()
+
+        assert openapi["info"]["title"] == "Calculator"
+        assert "/add" in openapi["paths"]
+        assert "/subtract" in openapi["paths"]
+        assert "post" in openapi["paths"]["/add"]
+        assert "post" in openapi["paths"]["/subtract"]
+
+    def test_openapi_response_schema_from_return_type(self, calculator_client):
+        openapi = calculator_client.app.openapi()
+
+        response_schema = openapi["paths"]["/add"]["post"]["responses"]["200"]["content"][
+            "application/json"
+        ]["schema"]
+        assert response_schema == {"$ref": "#/components/schemas/Result"}
+
+
+class TestHealthEndpoints:
+    """Tests for the liveness and readiness probes."""
+
+    def test_live_returns_200(self, process_client):
+        response = process_client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_ready_returns_503_before_startup(self):
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp)
+        client = TestClient(app)
+
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json() == {"status": "starting"}
+
+    def test_ready_returns_200_after_setup(self):
+        @jlserve.app()
+        class MyApp:
+            def setup(self):
+                self.loaded = True
+
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp)
+        with TestClient(app) as client:
+            response = client.get("/health/ready")
+            assert response.status_code == 200
+            assert response.json() == {"status": "ok"}
+
+    def test_health_routes_not_in_openapi(self, process_client):
+        assert "/health/live" not in process_client.app.openapi()["paths"]
 
+
+class TestStartupBanner:
+    """Tests for the startup banner printed from the lifespan."""
+
+    def test_banner_printed_after_setup_when_port_given(self, capsys):
         @jlserve.app(name="Calculator")
         class Calculator:
             @jlserve.endpoint()
             def add(self, input: TwoNumbers) -> Result:
                 return Result(result=input.a + input.b)
 
+        app = create_app(Calculator, port=9000)
+        assert "Serving" not in capsys.readouterr().out
+
+        with TestClient(app):
+            out = capsys.readouterr().out
+        assert "Serving Calculator at http://localhost:9000" in out
+        assert "POST /add" in out
+
+    def test_no_banner_without_port(self, capsys):
+        @jlserve.app()
+        class MyApp:
             @jlserve.endpoint()
-            def subtract(self, input: TwoNumbers) -> Result:
-                return Result(result=input.a - input.b)
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp)
+        with TestClient(app):
+            pass
+        assert "Serving" not in capsys.readouterr().out
+
+
+class TestDeferredModels:
+    """Tests for models declared with defer_build=True."""
+
+    def test_deferred_models_are_built_by_create_app(self):
+        class LazyInput(BaseModel):
+            model_config = ConfigDict(defer_build=True)
+            value: int
+
+        class LazyOutput(BaseModel):
+            model_config = ConfigDict(defer_build=True)
+            result: int
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def process(self, input: LazyInput) -> LazyOutput:
+                return LazyOutput(result=input.value * 2)
+
+        assert not LazyInput.__pydantic_complete__
+
+        create_app(MyApp)
+        assert LazyInput.__pydantic_complete__
+        assert LazyOutput.__pydantic_complete__
+
+    def test_first_request_to_deferred_models_builds_nothing(self):
+        class LazyInput(BaseModel):
+            model_config = ConfigDict(defer_build=True)
+            value: int
+
+        class LazyOutput(BaseModel):
+            model_config = ConfigDict(defer_build=True)
+            result: int
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def process(self, input: LazyInput) -> LazyOutput:
+                return LazyOutput(result=input.value * 2)
+
+        app = create_app(MyApp)
+        validator = LazyInput.__pydantic_validator__
+        serializer = LazyOutput.__pydantic_serializer__
+
+        with TestClient(app) as client:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                response = client.post("/process", json={"value": 2})
+            assert response.json() == {"result": 4}
+
+        assert LazyInput.__pydantic_validator__ is validator
+        assert LazyOutput.__pydantic_serializer__ is serializer
+
+
+class TestMsgspecStructs:
+    """Tests for endpoints that use msgspec Structs instead of Pydantic models."""
+
+    def test_struct_endpoint_round_trip(self):
+        msgspec = pytest.importorskip("msgspec")
+
+        class Pair(msgspec.Struct):
+            a: int
+            b: int
+
+        class Sum(msgspec.Struct):
+            result: int
+
+        @jlserve.app()
+        class Calculator:
+            @jlserve.endpoint()
+            def add(self, input: Pair) -> Sum:
+                return Sum(result=input.a + input.b)
 
         app = create_app(Calculator)
-        client = TestClient(app)
+        with TestClient(app) as client:
+            response = client.post("/add", json={"a": 5, "b": 3})
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            assert response.json() == {"result": 8}
 
-        response = client.get("/openapi.json")
-        assert response.status_code == 200
+    def test_struct_endpoint_invalid_input_returns_422(self):
+        msgspec = pytest.importorskip("msgspec")
 
-        openapi = response.json()
-        assert openapi["info"]["title"] == "Calculator"
-        assert "/add" in openapi["paths"]
-        assert "/subtract" in openapi["paths"]
-        assert "post" in openapi["paths"]["/add"]
-        assert "post" in openapi["paths"]["/subtract"]
+        class Pair(msgspec.Struct):
+            a: int
+            b: int
+
+        class Sum(msgspec.Struct):
+            result: int
+
+        @jlserve.app()
+        class Calculator:
+            @jlserve.endpoint()
+            async def add(self, input: Pair) -> Sum:
+                return Sum(result=input.a + input.b)
+
+        app = create_app(Calculator)
+        with TestClient(app) as client:
+            response = client.post("/add", json={"a": "five", "b": 3})
+            assert response.status_code == 422
+            assert response.json()["detail"] == [
+                {"type": "value_error", "loc": ["body", "a"], "msg": "Expected `int`, got `str`"}
+            ]
+
+    def test_struct_validation_error_loc_follows_path(self):
+        msgspec = pytest.importorskip("msgspec")
+
+        class Batch(msgspec.Struct):
+            values: list[int]
+
+        with pytest.raises(msgspec.ValidationError) as exc_info:
+            msgspec.json.decode(b'{"values": [1, "x"]}', type=Batch)
+        assert _struct_validation_errors(exc_info.value)[0]["loc"] == ["body", "values", 1]
+
+    def test_struct_endpoint_returns_503_before_startup(self):
+        msgspec = pytest.importorskip("msgspec")
+
+        class Pair(msgspec.Struct):
+            a: int
+            b: int
+
+        class Sum(msgspec.Struct):
+            result: int
+
+        @jlserve.app()
+        class Calculator:
+            @jlserve.endpoint()
+            def add(self, input: Pair) -> Sum:
+                return Sum(result=input.a + input.b)
+
+        response = TestClient(create_app(Calculator)).post("/add", json={"a": 1, "b": 2})
+        assert response.status_code == 503
+        assert response.json() == {"status": "starting"}
+
+    def test_mixed_struct_and_pydantic_raises_error(self):
+        msgspec = pytest.importorskip("msgspec")
+
+        class Pair(msgspec.Struct):
+            a: int
+            b: int
+
+        @jlserve.app()
+        class Calculator:
+            @jlserve.endpoint()
+            def add(self, input: Pair) -> Result:
+                return Result(result=input.a + input.b)
+
+        with pytest.raises(EndpointValidationError) as exc_info:
+            create_app(Calculator)
+        assert exc_info.value.code is ErrorCode.MIXED_IO_TYPES
+
+
+class TestProfiling:
+    """Tests for the opt-in pyinstrument profiling middleware."""
+
+    def test_profile_query_returns_html_report(self):
+        pytest.importorskip("pyinstrument")
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp, profile=True)
+        with TestClient(app) as client:
+            response = client.post("/process?profile=1", json={"value": 1})
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/html")
+
+    def test_requests_without_profile_query_pass_through(self):
+        pytest.importorskip("pyinstrument")
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        app = create_app(MyApp, profile=True)
+        with TestClient(app) as client:
+            response = client.post("/process", json={"value": 1})
+            assert response.json() == {"result": 1}
+
+    def test_profiler_stopped_when_endpoint_raises(self):
+        pytest.importorskip("pyinstrument")
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def boom(self, input: Input) -> Output:
+                raise RuntimeError("boom")
+
+            @jlserve.endpoint()
+            async def hooked(self, input: Input) -> Output:
+                return Output(result=int(sys.getprofile() is not None))
+
+        app = create_app(MyApp, profile=True)
+        with TestClient(app, raise_server_exceptions=False) as client:
+            assert client.post("/boom?profile=1", json={"value": 1}).status_code == 500
+            assert client.post("/hooked", json={"value": 1}).json() == {"result": 0}
+
+    def test_profiling_without_pyinstrument_names_extra(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyinstrument", None)
+
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def process(self, input: Input) -> Output:
+                return Output(result=input.value)
+
+        with pytest.raises(ImportError, match=r"pip install jlserve\[profile\]"):
+            create_app(MyApp, profile=True)
+
+    def test_profile_query_ignored_when_profiling_disabled(self, process_client):
+        response = process_client.post("/process?profile=1", json={"value": 1})
+        assert response.json() == {"result": 1}
@@ -1,27 +1,41 @@
 """Validation logic for JLServe app classes."""
 
-import inspect
-from typing import Callable, Type, get_type_hints
+import functools
+import sys
+from typing import Callable, Type, get_origin
 
 from pydantic import BaseModel
 
-from jlserve.decorator import get_endpoint_methods
-from jlserve.exceptions import EndpointValidationError
+from jlserve.decorator import EndpointMeta, _inspect_endpoint, get_endpoint_methods
+from jlserve.exceptions import EndpointValidationError, ErrorCode
 
 
 def validate_app(cls: Type) -> None:
     """Validate that an app class meets all requirements.
 
+    A class that passes is marked as validated, so validating it again (e.g.
+    by the CLI and then by create_app) returns immediately. The mark is read
+    from the class's own __dict__, so subclasses are validated on their own.
+
     Args:
         cls: The app class to validate.
 
     Raises:
         EndpointValidationError: If validation fails.
     """
+    if vars(cls).get("_jlserve_validated"):
+        return
+
     validate_is_jlserve_app(cls)
-    validate_has_endpoint_methods(cls)
-    validate_endpoint_methods(cls)
-    validate_no_duplicate_paths(cls)
+
+    # Look the endpoints up once and hand them to each check
+    methods = get_endpoint_methods(cls)
+    _check_has_endpoint_methods(cls, methods)
+    for method in methods:
+        validate_endpoint_method(method)
+    _check_no_duplicate_paths(methods)
+
+    cls._jlserve_validated = True
 
 
 def validate_is_jlserve_app(cls: Type) -> None:
@@ -32,7 +46,8 @@ def validate_is_jlserve_app(cls: Type) -> None:
     """
     if not getattr(cls, "_jlserve_app", False):
         raise EndpointValidationError(
-            f"Class {cls.__name__} must be decorated with @jlserve.app()"
+            f"Class {cls.__name__} must be decorated with @jlserve.app()",
+            ErrorCode.NOT_DECORATED,
         )
 
 
@@ -42,10 +57,14 @@ def validate_has_endpoint_methods(cls: Type) -> None:
     Raises:
         EndpointValidationError: If no endpoint methods are found.
     """
-    methods = get_endpoint_methods(cls)
+    _check_has_endpoint_methods(cls, get_endpoint_methods(cls))
+
+
+def _check_has_endpoint_methods(cls: Type, methods: tuple[Callable, ...]) -> None:
     if not methods:
         raise EndpointValidationError(
-            f"App {cls.__name__} must have at least one method decorated with @jlserve.endpoint()"
+            f"App {cls.__name__} must have at least one method decorated with @jlserve.endpoint()",
+            ErrorCode.NO_ENDPOINTS,
         )
 
 
@@ -57,9 +76,25 @@ def validate_endpoint_methods(cls: Type) -> None:
     """
     methods = get_endpoint_methods(cls)
     for method in methods:
-        validate_method_type_hints(method)
-        validate_method_input_is_pydantic_model(method)
-        validate_method_output_is_pydantic_model(method)
+        validate_endpoint_method(method)
+
+
+def validate_endpoint_method(method: Callable) -> None:
+    """Run every per-endpoint check against a single introspection of the method.
+
+    Equivalent to calling validate_method_type_hints,
+    validate_method_input_is_pydantic_model,
+    validate_method_output_is_pydantic_model and
+    validate_method_io_types_match in turn.
+
+    Raises:
+        EndpointValidationError: If any check fails.
+    """
+    meta = _introspect(method)
+    _check_type_hints(method, meta)
+    _check_input_type(method, meta.input_type)
+    _check_output_type(method, meta.output_type)
+    _check_io_types_match(method, meta.input_type, meta.output_type)
 
 
 def validate_method_type_hints(method: Callable) -> None:
@@ -68,60 +103,90 @@ def validate_method_type_hints(method: Callable) -> None:
     Raises:
         EndpointValidationError: If type hints are missing.
     """
-    hints = get_type_hints(method)
-    sig = inspect.signature(method)
-    params = list(sig.parameters.keys())
+    _check_type_hints(method, _introspect(method))
+
+
+def validate_method_input_is_pydantic_model(method: Callable) -> None:
+    """Check that the input type hint is a Pydantic BaseModel subclass.
+
+    A msgspec.Struct subclass is accepted as well, for apps that opt into
+    msgspec for request decoding.
+
+    Raises:
+        EndpointValidationError: If input is not a Pydantic model or msgspec Struct.
+    """
+    _check_input_type(method, _introspect(method).input_type)
+
+
+def validate_method_output_is_pydantic_model(method: Callable) -> None:
+    """Check that the return type hint is a Pydantic BaseModel subclass.
+
+    A msgspec.Struct subclass is accepted as well, for apps that opt into
+    msgspec for response encoding.
+
+    Raises:
+        EndpointValidationError: If output is not a Pydantic model or msgspec Struct.
+    """
+    _check_output_type(method, _introspect(method).output_type)
+
+
+def validate_method_io_types_match(method: Callable) -> None:
+    """Check that input and return types are both Pydantic models or both msgspec Structs.
+
+    Raises:
+        EndpointValidationError: If one side is a Pydantic model and the other a Struct.
+    """
+    _check_io_types_match(method, get_method_input_type(method), get_method_output_type(method))
 
+
+def _check_type_hints(method: Callable, meta: EndpointMeta) -> None:
     # Should have at least 'self' and one input parameter
-    if len(params) < 2:
+    input_param = meta.input_param
+    if input_param is None:
         raise EndpointValidationError(
-            f"Endpoint method {method.__name__}() must accept an input parameter with a type hint"
+            f"Endpoint method {method.__name__}() must accept an input parameter with a type hint",
+            ErrorCode.MISSING_INPUT_PARAMETER,
         )
 
     # The input parameter (second param after self)
-    input_param = params[1]
-    if input_param not in hints:
+    if meta.input_type is None:
         raise EndpointValidationError(
-            f"Endpoint method {method.__name__}() must have a type hint for input parameter '{input_param}'"
+            f"Endpoint method {method.__name__}() must have a type hint for input parameter '{input_param}'",
+            ErrorCode.MISSING_INPUT_HINT,
         )
 
     # Check return type
-    if "return" not in hints:
+    if meta.output_type is None:
         raise EndpointValidationError(
-            f"Endpoint method {method.__name__}() must have a return type hint"
+            f"Endpoint method {method.__name__}() must have a return type hint",
+            ErrorCode.MISSING_RETURN_HINT,
         )
 
 
-def validate_method_input_is_pydantic_model(method: Callable) -> None:
-    """Check that the input type hint is a Pydantic BaseModel subclass.
-
-    Raises:
-        EndpointValidationError: If input is not a Pydantic model.
-    """
-    hints = get_type_hints(method)
-    sig = inspect.signature(method)
-    params = list(sig.parameters.keys())
-    input_param = params[1]
-    input_type = hints.get(input_param)
-
-    if input_type is None or not _is_pydantic_model(input_type):
+def _check_input_type(method: Callable, input_type) -> None:
+    if input_type is None or not (_is_pydantic_model(input_type) or _is_msgspec_struct(input_type)):
         raise EndpointValidationError(
-            f"Endpoint method {method.__name__}(): input type must be a Pydantic BaseModel subclass, got {input_type}"
+            f"Endpoint method {method.__name__}(): input type must be a Pydantic BaseModel subclass "
+            f"or a msgspec.Struct subclass, got {input_type}",
+            ErrorCode.INVALID_INPUT_TYPE,
         )
 
 
-def validate_method_output_is_pydantic_model(method: Callable) -> None:
-    """Check that the return type hint is a Pydantic BaseModel subclass.
+def _check_output_type(method: Callable, output_type) -> None:
+    if output_type is None or not (_is_pydantic_model(output_type) or _is_msgspec_struct(output_type)):
+        raise EndpointValidationError(
+            f"Endpoint method {method.__name__}(): return type must be a Pydantic BaseModel subclass "
+            f"or a msgspec.Struct subclass, got {output_type}",
+            ErrorCode.INVALID_OUTPUT_TYPE,
+        )
 
-    Raises:
-        EndpointValidationError: If output is not a Pydantic model.
-    """
-    hints = get_type_hints(method)
-    output_type = hints.get("return")
 
-    if output_type is None or not _is_pydantic_model(output_type):
+def _check_io_types_match(method: Callable, input_type, output_type) -> None:
+    if _is_msgspec_struct(input_type) != _is_msgspec_struct(output_type):
         raise EndpointValidationError(
-            f"Endpoint method {method.__name__}(): return type must be a Pydantic BaseModel subclass, got {output_type}"
+            f"Endpoint method {method.__name__}(): input and return types must both be "
+            f"Pydantic models or both be msgspec Structs, got {input_type} and {output_type}",
+            ErrorCode.MIXED_IO_TYPES,
         )
 
 
@@ -131,23 +196,76 @@ def validate_no_duplicate_paths(cls: Type) -> None:
     Raises:
         EndpointValidationError: If duplicate paths are found.
     """
-    methods = get_endpoint_methods(cls)
+    _check_no_duplicate_paths(get_endpoint_methods(cls))
+
+
+def _check_no_duplicate_paths(methods: tuple[Callable, ...]) -> None:
     paths = {}
     for method in methods:
         path = method._jlserve_endpoint_path
         if path in paths:
             raise EndpointValidationError(
-                f"Duplicate endpoint path '{path}' found in methods {paths[path]}() and {method.__name__}()"
+                f"Duplicate endpoint path '{path}' found in methods {paths[path]}() and {method.__name__}()",
+                ErrorCode.DUPLICATE_PATH,
             )
         paths[path] = method.__name__
 
 
+def _introspect(method: Callable) -> EndpointMeta:
+    """Return an endpoint method's EndpointMeta.
+
+    @jlserve.endpoint() normally resolves it when the method is decorated.
+    If that was not possible (e.g. a forward reference to a model defined
+    later), it is resolved here and stored on the function, so repeated
+    checks on the same endpoint don't re-evaluate annotations or rebuild
+    its signature.
+    """
+    try:
+        return method._jlserve_meta
+    except AttributeError:
+        pass
+    meta = _inspect_endpoint(method)
+    method._jlserve_meta = meta
+    return meta
+
+
 def _is_pydantic_model(type_hint: Type) -> bool:
     """Check if a type is a Pydantic BaseModel subclass."""
-    try:
-        return isinstance(type_hint, type) and issubclass(type_hint, BaseModel)
-    except TypeError:
-        return False
+    # On Python 3.10, isinstance(list[X], type) is True, so parameterized
+    # generics are excluded by their origin rather than by isinstance alone
+    return (
+        isinstance(type_hint, type)
+        and get_origin(type_hint) is None
+        and _is_basemodel_subclass(type_hint)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_basemodel_subclass(cls: type) -> bool:
+    """Check the class's MRO for BaseModel.
+
+    Equivalent to issubclass(cls, BaseModel) for classes, without going
+    through the ABC machinery of pydantic's metaclass, whose subclass caches
+    grow with every class checked. Unlike issubclass, it is also safe for
+    generic aliases such as list[X], whose __mro__ is that of their origin:
+    on Python 3.10 those pass isinstance(t, type) and would make issubclass
+    raise TypeError. Do not replace it with issubclass.
+    """
+    return BaseModel in cls.__mro__
+
+
+def _is_msgspec_struct(type_hint: Type) -> bool:
+    """Check if a type is a msgspec.Struct subclass.
+
+    msgspec is optional: if it has not been imported, no annotation can
+    refer to a Struct, so there is no need to import it here.
+    """
+    msgspec = sys.modules.get("msgspec")
+    return (
+        msgspec is not None
+        and isinstance(type_hint, type)
+        and issubclass(type_hint, msgspec.Struct)
+    )
 
 
 def get_method_input_type(method: Callable) -> Type[BaseModel]:
@@ -159,11 +277,7 @@ def get_method_input_type(method: Callable) -> Type[BaseModel]:
     Returns:
         The Pydantic BaseModel subclass used as input type.
     """
-    hints = get_type_hints(method)
-    sig = inspect.signature(method)
-    params = list(sig.parameters.keys())
-    input_param = params[1]
-    return hints[input_param]
+    return _introspect(method).input_type
 
 
 def get_method_output_type(method: Callable) -> Type[BaseModel]:
@@ -175,5 +289,19 @@ def get_method_output_type(method: Callable) -> Type[BaseModel]:
     Returns:
         The Pydantic BaseModel subclass used as return type.
     """
-    hints = get_type_hints(method)
-    return hints["return"]
+    return _introspect(method).output_type
+
+
+def get_method_output_construct(method: Callable) -> Callable[..., BaseModel]:
+    """Get the output model's ``model_construct`` from an endpoint method.
+
+    ``model_construct`` builds the model without validating its fields, so
+    it is only safe for trusted data.
+
+    Args:
+        method: The endpoint method to inspect.
+
+    Returns:
+        The ``model_construct`` classmethod of the return type.
+    """
+    return get_method_output_type(method).model_construct
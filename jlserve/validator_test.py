@@ -4,12 +4,15 @@ import pytest
 from pydantic import BaseModel
 
 import jlserve
-from jlserve.decorator import _reset_registry
-from jlserve.exceptions import EndpointValidationError
+from jlserve import decorator
+from jlserve._test_models import Input, Output
+from jlserve.decorator import _reset_registry, get_endpoint_methods
+from jlserve.exceptions import EndpointValidationError, ErrorCode
 from jlserve.validator import (
     get_method_input_type,
     get_method_output_type,
     validate_app,
+    validate_endpoint_method,
     validate_has_endpoint_methods,
     validate_is_jlserve_app,
     validate_method_input_is_pydantic_model,
@@ -19,27 +22,53 @@ from jlserve.validator import (
 )
 
 
-class Input(BaseModel):
-    value: int
+# Endpoint methods with broken signatures. Validating a method does not need
+# an app class, so these are decorated once at import time.
+@jlserve.endpoint()
+def _missing_input_hint(self, input) -> Output:
+    pass
 
 
-class Output(BaseModel):
-    result: int
+@jlserve.endpoint()
+def _missing_return_hint(self, input: Input):
+    pass
 
 
-class TestValidateIsJarvisApp:
-    """Tests for validate_is_jlserve_app function."""
+@jlserve.endpoint()
+def _no_input_parameter(self) -> Output:
+    pass
 
-    def test_valid_app_class(self):
-        _reset_registry()
 
-        @jlserve.app()
-        class ValidApp:
-            @jlserve.endpoint()
-            def my_method(self, input: Input) -> Output:
-                pass
+@pytest.fixture(scope="module")
+def valid_app_cls():
+    """A valid single-endpoint app, shared by tests that only read it."""
+    _reset_registry()
+
+    @jlserve.app()
+    class ValidApp:
+        @jlserve.endpoint()
+        def my_method(self, input: Input) -> Output:
+            pass
+
+    _reset_registry()
+    return ValidApp
+
 
-        validate_is_jlserve_app(ValidApp)
+def _endpoint_with(input_type, output_type):
+    """Build an endpoint method annotated with the given runtime types."""
+
+    def my_method(self, input):
+        pass
+
+    my_method.__annotations__ = {"input": input_type, "return": output_type}
+    return jlserve.endpoint()(my_method)
+
+
+class TestValidateIsJLServeApp:
+    """Tests for validate_is_jlserve_app function."""
+
+    def test_valid_app_class(self, valid_app_cls):
+        validate_is_jlserve_app(valid_app_cls)
 
     def test_class_without_app_decorator(self):
         class NotAnApp:
@@ -47,26 +76,16 @@ class TestValidateIsJarvisApp:
 
         with pytest.raises(EndpointValidationError) as exc_info:
             validate_is_jlserve_app(NotAnApp)
-        assert "must be decorated with @jlserve.app()" in str(exc_info.value)
+        assert exc_info.value.code is ErrorCode.NOT_DECORATED
 
 
 class TestValidateHasEndpointMethods:
     """Tests for validate_has_endpoint_methods function."""
 
-    def test_app_with_endpoints(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class ValidApp:
-            @jlserve.endpoint()
-            def my_method(self, input: Input) -> Output:
-                pass
-
-        validate_has_endpoint_methods(ValidApp)
+    def test_app_with_endpoints(self, valid_app_cls):
+        validate_has_endpoint_methods(valid_app_cls)
 
     def test_app_without_endpoints(self):
-        _reset_registry()
-
         @jlserve.app()
         class EmptyApp:
             def helper(self):
@@ -74,183 +93,119 @@ class TestValidateHasEndpointMethods:
 
         with pytest.raises(EndpointValidationError) as exc_info:
             validate_has_endpoint_methods(EmptyApp)
-        assert "must have at least one method decorated with @jlserve.endpoint()" in str(
-            exc_info.value
-        )
+        assert exc_info.value.code is ErrorCode.NO_ENDPOINTS
 
 
 class TestValidateMethodTypeHints:
     """Tests for validate_method_type_hints function."""
 
-    def test_valid_type_hints(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class ValidApp:
-            @jlserve.endpoint()
-            def my_method(self, input: Input) -> Output:
-                pass
-
-        from jlserve.decorator import get_endpoint_methods
-
-        methods = get_endpoint_methods(ValidApp)
-        validate_method_type_hints(methods[0])
-
-    def test_missing_input_type_hint(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class InvalidApp:
-            @jlserve.endpoint()
-            def my_method(self, input) -> Output:
-                pass
-
-        from jlserve.decorator import get_endpoint_methods
-
-        methods = get_endpoint_methods(InvalidApp)
+    def test_valid_type_hints(self, valid_app_cls):
+        validate_method_type_hints(valid_app_cls.my_method)
+
+    @pytest.mark.parametrize(
+        "method, expected_code",
+        [
+            (_missing_input_hint, ErrorCode.MISSING_INPUT_HINT),
+            (_missing_return_hint, ErrorCode.MISSING_RETURN_HINT),
+            (_no_input_parameter, ErrorCode.MISSING_INPUT_PARAMETER),
+        ],
+        ids=["missing_input_hint", "missing_return_hint", "no_input_parameter"],
+    )
+    def test_invalid_type_hints(self, method, expected_code):
         with pytest.raises(EndpointValidationError) as exc_info:
-            validate_method_type_hints(methods[0])
-        assert "must have a type hint for input parameter" in str(exc_info.value)
-
-    def test_missing_return_type_hint(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class InvalidApp:
-            @jlserve.endpoint()
-            def my_method(self, input: Input):
-                pass
+            validate_method_type_hints(method)
+        assert exc_info.value.code is expected_code
 
-        from jlserve.decorator import get_endpoint_methods
 
-        methods = get_endpoint_methods(InvalidApp)
-        with pytest.raises(EndpointValidationError) as exc_info:
-            validate_method_type_hints(methods[0])
-        assert "must have a return type hint" in str(exc_info.value)
-
-    def test_no_input_parameter(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class InvalidApp:
-            @jlserve.endpoint()
-            def my_method(self) -> Output:
-                pass
+class TestValidateMethodInputIsPydanticModel:
+    """Tests for validate_method_input_is_pydantic_model function."""
 
-        from jlserve.decorator import get_endpoint_methods
+    def test_valid_pydantic_input(self, valid_app_cls):
+        validate_method_input_is_pydantic_model(valid_app_cls.my_method)
 
-        methods = get_endpoint_methods(InvalidApp)
+    @pytest.mark.parametrize(
+        "bad_type",
+        [str, int, dict, list, list[Input]],
+        ids=["str", "int", "dict", "list", "list_of_model"],
+    )
+    def test_input_is_not_pydantic_model(self, bad_type):
+        method = _endpoint_with(input_type=bad_type, output_type=Output)
         with pytest.raises(EndpointValidationError) as exc_info:
-            validate_method_type_hints(methods[0])
-        assert "must accept an input parameter" in str(exc_info.value)
-
+            validate_method_input_is_pydantic_model(method)
+        assert exc_info.value.code is ErrorCode.INVALID_INPUT_TYPE
 
-class TestValidateMethodInputIsPydanticModel:
-    """Tests for validate_method_input_is_pydantic_model function."""
-
-    def test_valid_pydantic_input(self):
-        _reset_registry()
+    def test_input_subclass_of_subclass(self):
+        class DerivedInput(Input):
+            extra: str = ""
 
         @jlserve.app()
         class ValidApp:
             @jlserve.endpoint()
-            def my_method(self, input: Input) -> Output:
+            def my_method(self, input: DerivedInput) -> Output:
                 pass
 
-        from jlserve.decorator import get_endpoint_methods
-
         methods = get_endpoint_methods(ValidApp)
         validate_method_input_is_pydantic_model(methods[0])
 
-    def test_input_is_not_pydantic_model(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class InvalidApp:
-            @jlserve.endpoint()
-            def my_method(self, input: str) -> Output:
-                pass
 
-        from jlserve.decorator import get_endpoint_methods
-
-        methods = get_endpoint_methods(InvalidApp)
-        with pytest.raises(EndpointValidationError) as exc_info:
-            validate_method_input_is_pydantic_model(methods[0])
-        assert "input type must be a Pydantic BaseModel subclass" in str(exc_info.value)
-
-    def test_input_is_dict(self):
-        _reset_registry()
-
-        @jlserve.app()
-        class InvalidApp:
-            @jlserve.endpoint()
-            def my_method(self, input: dict) -> Output:
-                pass
+class TestValidateMethodOutputIsPydanticModel:
+    """Tests for validate_method_output_is_pydantic_model function."""
 
-        from jlserve.decorator import get_endpoint_methods
+    def test_valid_pydantic_output(self, valid_app_cls):
+        validate_method_output_is_pydantic_model(valid_app_cls.my_method)
 
-        methods = get_endpoint_methods(InvalidApp)
+    @pytest.mark.parametrize(
+        "bad_type", [str, int, dict, list], ids=["str", "int", "dict", "list"]
+    )
+    def test_output_is_not_pydantic_model(self, bad_type):
+        method = _endpoint_with(input_type=Input, output_type=bad_type)
         with pytest.raises(EndpointValidationError) as exc_info:
-            validate_method_input_is_pydantic_model(methods[0])
-        assert "input type must be a Pydantic BaseModel subclass" in str(exc_info.value)
+            validate_method_output_is_pydantic_model(method)
+        assert exc_info.value.code is ErrorCode.INVALID_OUTPUT_TYPE
 
 
-class TestValidateMethodOutputIsPydanticModel:
-    """Tests for validate_method_output_is_pydantic_model function."""
-
-    def test_valid_pydantic_output(self):
-        _reset_registry()
+class TestValidateEndpointMethod:
+    """Tests for validate_endpoint_method, which runs all per-endpoint checks."""
 
+    def test_valid_endpoint(self):
         @jlserve.app()
-        class ValidApp:
+        class MyApp:
             @jlserve.endpoint()
             def my_method(self, input: Input) -> Output:
                 pass
 
-        from jlserve.decorator import get_endpoint_methods
-
-        methods = get_endpoint_methods(ValidApp)
-        validate_method_output_is_pydantic_model(methods[0])
-
-    def test_output_is_not_pydantic_model(self):
-        _reset_registry()
+        # Should not raise
+        validate_endpoint_method(MyApp.my_method)
 
+    def test_missing_return_type_hint_checked_before_types(self):
         @jlserve.app()
-        class InvalidApp:
+        class MyApp:
             @jlserve.endpoint()
-            def my_method(self, input: Input) -> str:
+            def my_method(self, input: dict):
                 pass
 
-        from jlserve.decorator import get_endpoint_methods
-
-        methods = get_endpoint_methods(InvalidApp)
         with pytest.raises(EndpointValidationError) as exc_info:
-            validate_method_output_is_pydantic_model(methods[0])
-        assert "return type must be a Pydantic BaseModel subclass" in str(exc_info.value)
+            validate_endpoint_method(MyApp.my_method)
 
-    def test_output_is_dict(self):
-        _reset_registry()
+        assert exc_info.value.code is ErrorCode.MISSING_RETURN_HINT
 
+    def test_invalid_output_type(self):
         @jlserve.app()
-        class InvalidApp:
+        class MyApp:
             @jlserve.endpoint()
             def my_method(self, input: Input) -> dict:
                 pass
 
-        from jlserve.decorator import get_endpoint_methods
-
-        methods = get_endpoint_methods(InvalidApp)
         with pytest.raises(EndpointValidationError) as exc_info:
-            validate_method_output_is_pydantic_model(methods[0])
-        assert "return type must be a Pydantic BaseModel subclass" in str(exc_info.value)
+            validate_endpoint_method(MyApp.my_method)
+
+        assert exc_info.value.code is ErrorCode.INVALID_OUTPUT_TYPE
 
 
 class TestValidateNoDuplicatePaths:
     """Tests for validate_no_duplicate_paths function."""
 
     def test_unique_paths(self):
-        _reset_registry()
-
         @jlserve.app()
         class ValidApp:
             @jlserve.endpoint()
@@ -268,8 +223,6 @@ class TestValidateNoDuplicatePaths:
         pass  # Method names are unique by Python rules
 
     def test_duplicate_custom_paths(self):
-        _reset_registry()
-
         @jlserve.app()
         class InvalidApp:
             @jlserve.endpoint(path="/same")
@@ -282,15 +235,13 @@ class TestValidateNoDuplicatePaths:
 
         with pytest.raises(EndpointValidationError) as exc_info:
             validate_no_duplicate_paths(InvalidApp)
-        assert "Duplicate endpoint path '/same'" in str(exc_info.value)
+        assert exc_info.value.code is ErrorCode.DUPLICATE_PATH
 
 
 class TestValidateApp:
     """Tests for the main validate_app function."""
 
     def test_valid_app(self):
-        _reset_registry()
-
         @jlserve.app()
         class ValidApp:
             @jlserve.endpoint()
@@ -304,8 +255,6 @@ class TestValidateApp:
         validate_app(ValidApp)
 
     def test_valid_app_with_setup(self):
-        _reset_registry()
-
         @jlserve.app()
         class ValidApp:
             def setup(self):
@@ -326,8 +275,6 @@ class TestValidateApp:
             validate_app(NotAnApp)
 
     def test_invalid_app_no_endpoints(self):
-        _reset_registry()
-
         @jlserve.app()
         class EmptyApp:
             pass
@@ -336,8 +283,6 @@ class TestValidateApp:
             validate_app(EmptyApp)
 
     def test_invalid_app_bad_type_hints(self):
-        _reset_registry()
-
         @jlserve.app()
         class InvalidApp:
             @jlserve.endpoint()
@@ -347,34 +292,112 @@ class TestValidateApp:
         with pytest.raises(EndpointValidationError):
             validate_app(InvalidApp)
 
+    def test_validated_app_is_not_revalidated(self, monkeypatch):
+        @jlserve.app()
+        class ValidApp:
+            @jlserve.endpoint()
+            def add(self, input: Input) -> Output:
+                return Output(result=input.value + 1)
+
+        validate_app(ValidApp)
+
+        calls = []
+        monkeypatch.setattr(
+            "jlserve.validator.validate_endpoint_method", calls.append
+        )
+        validate_app(ValidApp)
+        assert calls == []
+
+    def test_failed_validation_is_not_memoized(self):
+        @jlserve.app()
+        class InvalidApp:
+            @jlserve.endpoint()
+            def my_method(self, input: str) -> str:
+                pass
+
+        for _ in range(2):
+            with pytest.raises(EndpointValidationError):
+                validate_app(InvalidApp)
+
+    def test_subclass_of_validated_app_is_validated(self):
+        @jlserve.app()
+        class ValidApp:
+            @jlserve.endpoint()
+            def add(self, input: Input) -> Output:
+                return Output(result=input.value + 1)
+
+        validate_app(ValidApp)
+
+        class BrokenSubclass(ValidApp):
+            @jlserve.endpoint()
+            def add(self, input: str) -> Output:
+                pass
+
+        with pytest.raises(EndpointValidationError):
+            validate_app(BrokenSubclass)
+
 
 class TestGetMethodTypes:
     """Tests for get_method_input_type and get_method_output_type functions."""
 
     def test_get_method_input_type(self):
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
             def my_method(self, input: Input) -> Output:
                 pass
 
-        from jlserve.decorator import get_endpoint_methods
-
         methods = get_endpoint_methods(MyApp)
         assert get_method_input_type(methods[0]) is Input
 
     def test_get_method_output_type(self):
-        _reset_registry()
-
         @jlserve.app()
         class MyApp:
             @jlserve.endpoint()
             def my_method(self, input: Input) -> Output:
                 pass
 
-        from jlserve.decorator import get_endpoint_methods
-
         methods = get_endpoint_methods(MyApp)
         assert get_method_output_type(methods[0]) is Output
+
+    def test_type_hints_resolved_at_decoration(self, monkeypatch):
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def my_method(self, input: Input) -> Output:
+                pass
+
+        calls = []
+        monkeypatch.setattr(decorator, "get_type_hints", calls.append)
+
+        validate_app(MyApp)
+        assert get_method_input_type(MyApp.my_method) is Input
+        assert calls == []
+
+    def test_forward_reference_resolved_once_by_validator(self, monkeypatch):
+        @jlserve.app()
+        class MyApp:
+            @jlserve.endpoint()
+            def my_method(self, input: "LaterInput") -> Output:
+                pass
+
+        # Not resolvable when the endpoint was decorated
+        assert not hasattr(MyApp.my_method, "_jlserve_meta")
+
+        class LaterInput(BaseModel):
+            value: int
+
+        monkeypatch.setitem(globals(), "LaterInput", LaterInput)
+
+        calls = []
+        real_get_type_hints = decorator.get_type_hints
+        monkeypatch.setattr(
+            decorator,
+            "get_type_hints",
+            lambda obj: calls.append(obj) or real_get_type_hints(obj),
+        )
+
+        validate_app(MyApp)
+        validate_app(MyApp)
+        assert get_method_input_type(MyApp.my_method) is LaterInput
+        assert len(calls) == 1